@@ -0,0 +1,61 @@
+import random
+import sys
+import timeit
+
+from rapidfuzz import fuzz
+
+from constants import FUZZY_RATIO_MATCH
+from title_filter import get_title_matches
+
+TITLE_WORDS = ['Software', 'Engineer', 'Senior', 'Machine', 'Learning', 'Data', 'Scientist', 'Backend',
+               'Frontend', 'Full', 'Stack', 'Developer', 'II', 'III', 'New', 'Grad', 'AI', 'Research',
+               'Platform', 'Cloud', 'Applied', 'Analyst', 'Product', 'Systems', 'Mobile', 'iOS', 'Android']
+
+
+def get_random_titles(number_of_titles: int, seed: int = 0):
+    """builds job titles looking like the ones of a full catalog fetch
+
+    Args:
+        number_of_titles (int): number of job titles
+        seed (int): random seed, so every run scores the same titles
+
+    Returns:
+        List[str]: job titles
+    """
+    generator = random.Random(seed)
+    return [' '.join(generator.sample(TITLE_WORDS, generator.randint(2, 5))) for _ in range(number_of_titles)]
+
+
+def get_title_matches_per_pair(job_titles, keywords):
+    """gets the keywords matched by each job title with one ratio call per pair, like the parsers used to
+
+    Args:
+        job_titles (List[str]): job titles
+        keywords (List[str]): keywords of the company
+
+    Returns:
+        List[FrozenSet[str]]: matched keywords, in the order of the job titles
+    """
+    return [frozenset(keyword for keyword in keywords
+                      if int(round(fuzz.ratio(job_title, keyword))) > FUZZY_RATIO_MATCH)
+            for job_title in job_titles]
+
+
+def main():
+    number_of_titles = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    job_titles = get_random_titles(number_of_titles)
+    keywords = get_random_titles(12, seed=1)
+    if get_title_matches(job_titles, keywords) != get_title_matches_per_pair(job_titles, keywords):
+        print('Error, the score matrix and the per pair ratios disagree')
+        return
+    per_pair_seconds = min(timeit.repeat(lambda: get_title_matches_per_pair(job_titles, keywords),
+                                         number=1, repeat=5))
+    matrix_seconds = min(timeit.repeat(lambda: get_title_matches(job_titles, keywords),
+                                       number=1, repeat=5))
+    print(f'{number_of_titles} titles x {len(keywords)} keywords')
+    print(f'per pair ratio: {per_pair_seconds * 1000:.1f} ms')
+    print(f'score matrix:   {matrix_seconds * 1000:.1f} ms ({per_pair_seconds / matrix_seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
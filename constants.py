@@ -6,9 +6,20 @@ COMPANY_NAMES_CSV = 'company_data.csv'
 COMPANY_SEARCH_API_CSV = 'search_api.csv'
 COMPANY_KEYWORDS_CSV = 'keywords.csv'
 COMPANY_KNOWN_JOBS_CSV = 'already_known_jobs.csv'
+COMPANY_KNOWN_JOBS_DB = 'known_jobs.db'
+IMPORTED_CSV_SUFFIX = '.imported'
+KNOWN_JOBS_RETENTION_DAYS = 30
+KNOWN_JOBS_PRUNE_INTERVAL_HOURS = 24
 COMPANY_SEARCH_API_HEADER_CSV = 'search_headers.csv'
 COMPANY_STATUS_CSV = 'company_status.csv'
 COMPANY_SEARCH_API_EXTRA_HEADER_CSV = 'search_extra_headers.csv'
+COMPANY_PORTAL_PARAMS_CSV = 'portal_params.csv'
+COMPANY_TERMS_TO_IGNORE_CSV = 'terms_to_ignore.csv'
+PORTAL_REGISTRY_CSV = 'portal_registry.csv'
+JOB_DETAILS_DB = 'job_details.db'
+JOB_DETAILS_TTL_DAYS = 30
+JOB_DETAILS_MAX_ENTRIES = 50000
+JOB_DETAILS_EVICT_INTERVAL_HOURS = 1
 
 # Log File Location
 LOG_FOLDER_LOCATION = os.path.join(os.getcwd(), "log")
@@ -16,11 +27,61 @@ LOG_FILE_NAME = "log.log"
 SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK_VAR = 'SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK'
 SLACK_ERROR_NOTIFICATION_WEBHOOK_VAR = 'SLACK_ERROR_NOTIFICATION_WEBHOOK'
 SLACK_JOB_NOTIFICATION_WEBHOOK_VAR = 'SLACK_JOB_NOTIFICATION_WEBHOOK'
+SLACK_JOBS_PER_MESSAGE = 10
+SLACK_OUTBOX_DB = 'slack_outbox.db'
+SLACK_OUTBOX_RESEND_AFTER_SECONDS = 300
+SLACK_MESSAGES_PER_SECOND = 1
+SLACK_MESSAGE_BURST = 5
+SLACK_MAX_RETRIES = 4
+SLACK_RETRY_BACKOFF_SECONDS = 1
 
 FUZZY_RATIO_MATCH = 50
+POSTED_DATE_CACHE_SIZE = 65536
 DAYS_TO_CHECK = 7
 
-# Terms to Ignore
+# Concurrency
+MAX_COMPANY_WORKERS = 4
+MAX_REQUESTS_PER_HOST = 2
+MAX_KEYWORD_WORKERS = 4
+MAX_HTTP_CONNECTIONS = 100
+HTTP_TIMEOUT_SECONDS = 60
+PARALLEL_PAGINATION = True
+PAGINATION_PREFETCH_PAGES = 4
+PAGINATION_DATE_SORTED_PREFETCH_PAGES = 1
+
+# HTTP Cache
+# Search responses with an ETag or a Last-Modified header are kept in
+# data/http_cache.db and revalidated with a conditional request on every poll.
+# The least recently used responses are dropped above HTTP_CACHE_MAX_BYTES or
+# once unused for HTTP_CACHE_EXPIRE_DAYS.
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DB = 'http_cache.db'
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+HTTP_CACHE_EXPIRE_DAYS = 7
+HTTP_CACHE_EVICT_INTERVAL_MINUTES = 30
+
+# Daemon Mode
+# A company is polled every COMPANY_POLL_INTERVAL_MINUTES until its new job
+# arrival rate is known, then often enough to expect POLL_TARGET_NEW_JOBS new
+# jobs per poll, within the MIN and MAX intervals. The interval grows by at most
+# MAX_POLL_INTERVAL_GROWTH per poll. The PollIntervalMinutes column of its
+# company_status.csv row fixes the interval instead.
+COMPANY_POLL_INTERVAL_MINUTES = 20
+ADAPTIVE_POLLING = True
+POLL_TARGET_NEW_JOBS = 0.5
+MIN_COMPANY_POLL_INTERVAL_MINUTES = 5
+MAX_COMPANY_POLL_INTERVAL_MINUTES = 240
+MAX_POLL_INTERVAL_GROWTH = 2
+ARRIVAL_RATE_HALF_LIFE_HOURS = 72
+COMPANY_POLL_JITTER_RATIO = 0.1
+COMPANY_POLL_MAX_BACKOFF_MINUTES = 240
+DAEMON_RELOAD_CHECK_SECONDS = 30
+DAEMON_LOG_FOLDER_NAME = 'daemon'
+DAEMON_LOG_MAX_BYTES = 10 * 1024 * 1024
+DAEMON_LOG_BACKUP_COUNT = 3
+
+# Terms to Ignore, a set's terms_to_ignore.csv replaces them for that set
+TITLE_FILTER_CACHE_SIZE = 65536
 TERMS_TO_IGNORE = [
     "Embedded",
     "Manager",
@@ -0,0 +1,66 @@
+import logging
+from typing import Dict
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+from parsed_documents import get_parsed_document
+
+
+def parse_page(html: str) -> BeautifulSoup:
+    """parses a whole page with html.parser
+
+    Args:
+        html (str): page html
+
+    Returns:
+        BeautifulSoup: soup of the page
+    """
+    return get_parsed_document(html, 'html.parser', lambda: BeautifulSoup(html.strip(), 'html.parser'))
+
+
+def parse_html(html: str, name: str, attrs: Dict) -> BeautifulSoup:
+    """parses only the elements a portal reads from a page
+
+    With lxml installed the page is streamed through a SoupStrainer, so only
+    the wanted elements and their children end up in the tree. When lxml is
+    missing, fails or finds none of the elements, the whole page is parsed
+    with html.parser like before.
+
+    Args:
+        html (str): page html
+        name (str): tag name of the wanted elements
+        attrs (Dict): attributes of the wanted elements, as given to find_all
+
+    Returns:
+        BeautifulSoup: soup holding the wanted elements, searched with find_all as usual
+    """
+    return get_parsed_document(html, (name, repr(sorted(attrs.items()))),
+                               lambda: parse_html_elements(html, name, attrs))
+
+
+def parse_html_elements(html: str, name: str, attrs: Dict) -> BeautifulSoup:
+    """parses the wanted elements of a page, see parse_html
+
+    Args:
+        html (str): page html
+        name (str): tag name of the wanted elements
+        attrs (Dict): attributes of the wanted elements, as given to find_all
+
+    Returns:
+        BeautifulSoup: soup holding the wanted elements
+    """
+    if builder_registry.lookup('lxml') is not None:
+        strainer_attrs = dict(attrs)
+        if isinstance(attrs.get('class'), str):
+            # while parsing, the strainer sees the raw class attribute, so
+            # match it token by token like find_all does
+            wanted_class = attrs['class']
+            strainer_attrs['class'] = lambda classes: classes is not None and wanted_class in classes.split()
+        try:
+            soup = BeautifulSoup(html, 'lxml', parse_only=SoupStrainer(name, strainer_attrs))
+            if soup.find(name, attrs) is not None:
+                return soup
+        except Exception as e:
+            logging.warning(f'Streaming html parse failed, parsing the whole page: {e}')
+    return BeautifulSoup(html.strip(), 'html.parser')
@@ -0,0 +1,151 @@
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from constants import HTTP_CACHE_DB, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_EXPIRE_DAYS, HTTP_CACHE_EVICT_INTERVAL_MINUTES
+from sqlite_cache import new_sqlite_cache, open_sqlite_cache, evict_sqlite_cache_if_due, close_sqlite_cache
+
+
+# when the cached responses were last used, kept in memory and written with
+# the eviction or on close, so serving a response doesn't cost a commit
+last_used_times = {}
+
+
+def write_last_used(connection: sqlite3.Connection):
+    """writes the last used times kept in memory, the caller holds the cache lock
+
+    Args:
+        connection (sqlite3.Connection): http cache database
+    """
+    if last_used_times:
+        connection.executemany('UPDATE http_cache SET last_used = MAX(last_used, ?) WHERE request_key = ?',
+                               [(last_used, request_key) for request_key, last_used in last_used_times.items()])
+        last_used_times.clear()
+
+
+def evict_http_cache(connection: sqlite3.Connection) -> int:
+    """drops the entries unused for HTTP_CACHE_EXPIRE_DAYS and the least recently used ones above HTTP_CACHE_MAX_BYTES
+
+    Args:
+        connection (sqlite3.Connection): http cache database
+
+    Returns:
+        int: number of dropped entries
+    """
+    write_last_used(connection)
+    unused_before = datetime.now() - timedelta(days=HTTP_CACHE_EXPIRE_DAYS)
+    dropped_entries = connection.execute('DELETE FROM http_cache WHERE last_used < ?',
+                                         (unused_before.isoformat(timespec='seconds'),)).rowcount
+    dropped_entries += connection.execute('''DELETE FROM http_cache WHERE request_key IN (
+                                                 SELECT request_key FROM (
+                                                     SELECT request_key, SUM(size) OVER (
+                                                         ORDER BY last_used DESC, request_key) AS kept_size
+                                                     FROM http_cache)
+                                                 WHERE kept_size > ?)''', (HTTP_CACHE_MAX_BYTES,)).rowcount
+    return dropped_entries
+
+
+# Search responses of every set, keyed by the hash of the canonical request.
+# A response is never served without asking the portal, its ETag and
+# Last-Modified are sent back so an unchanged board costs a 304.
+http_cache = new_sqlite_cache(HTTP_CACHE_DB, 2, [
+    '''CREATE TABLE IF NOT EXISTS http_cache (
+           request_key TEXT PRIMARY KEY,
+           body TEXT NOT NULL,
+           content_type TEXT NOT NULL,
+           etag TEXT,
+           last_modified TEXT,
+           size INTEGER NOT NULL,
+           last_used TEXT NOT NULL)''',
+    'CREATE INDEX IF NOT EXISTS http_cache_last_used ON http_cache (last_used)'],
+    evict_http_cache, timedelta(minutes=HTTP_CACHE_EVICT_INTERVAL_MINUTES))
+
+
+def is_cacheable(cache_control: str, etag: Optional[str], last_modified: Optional[str]) -> bool:
+    """tells whether a response can be revalidated later and the portal allows storing it
+
+    Responses without a validator aren't kept. A poll may come sooner than
+    any expiry, and serving it a stored board would hide its new jobs and
+    slow down the adaptive polling of the company.
+
+    Args:
+        cache_control (str): Cache-Control header of the response
+        etag (Optional[str]): ETag header of the response
+        last_modified (Optional[str]): Last-Modified header of the response
+
+    Returns:
+        bool: True when the response should be cached
+    """
+    return bool(etag or last_modified) and 'no-store' not in cache_control.lower()
+
+
+def get_cached_response(request_key: str) -> Optional[Dict]:
+    """gets the cached response of a request and marks it as used
+
+    It blocks on the database, so the engine runs it off its event loop.
+
+    Args:
+        request_key (str): hash of the canonical request
+
+    Returns:
+        Optional[Dict]: body, content_type, etag and last_modified, None when the request isn't cached
+    """
+    connection = open_sqlite_cache(http_cache)
+    with http_cache['lock']:
+        row = connection.execute('''SELECT body, content_type, etag, last_modified
+                                    FROM http_cache WHERE request_key = ?''', (request_key,)).fetchone()
+        if row is None:
+            return None
+        last_used_times[request_key] = datetime.now().isoformat(timespec='seconds')
+    body, content_type, etag, last_modified = row
+    return {'body': body, 'content_type': content_type, 'etag': etag, 'last_modified': last_modified}
+
+
+def get_conditional_headers(cached_response: Optional[Dict]) -> Dict:
+    """gets the headers asking the portal for the response only when it changed
+
+    Args:
+        cached_response (Optional[Dict]): cached response of the request, see get_cached_response
+
+    Returns:
+        Dict: If-None-Match and If-Modified-Since headers, empty without a cached response
+    """
+    conditional_headers = {}
+    if cached_response is None:
+        return conditional_headers
+    if cached_response['etag']:
+        conditional_headers['If-None-Match'] = cached_response['etag']
+    if cached_response['last_modified']:
+        conditional_headers['If-Modified-Since'] = cached_response['last_modified']
+    return conditional_headers
+
+
+def store_response(request_key: str, body: str, content_type: str, etag: Optional[str],
+                   last_modified: Optional[str]):
+    """caches the response of a request, replacing the previous one
+
+    Args:
+        request_key (str): hash of the canonical request
+        body (str): response text
+        content_type (str): Content-Type header of the response
+        etag (Optional[str]): ETag header of the response
+        last_modified (Optional[str]): Last-Modified header of the response
+    """
+    connection = open_sqlite_cache(http_cache)
+    now = datetime.now()
+    with http_cache['lock']:
+        connection.execute('''INSERT OR REPLACE INTO http_cache (request_key, body, content_type, etag,
+                                  last_modified, size, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                           (request_key, body, content_type, etag, last_modified, len(body),
+                            now.isoformat(timespec='seconds')))
+        connection.commit()
+        evict_sqlite_cache_if_due(http_cache)
+
+
+def close_http_cache():
+    """writes the last used times and closes the http cache database"""
+    with http_cache['lock']:
+        if http_cache['connection'] is not None:
+            write_last_used(http_cache['connection'])
+            http_cache['connection'].commit()
+    close_sqlite_cache(http_cache)
@@ -0,0 +1,301 @@
+import asyncio
+import contextvars
+import functools
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from constants import MAX_HTTP_CONNECTIONS, MAX_REQUESTS_PER_HOST, HTTP_TIMEOUT_SECONDS, HTTP_CACHE_ENABLED
+from http_cache import get_cached_response, get_conditional_headers, is_cacheable, store_response
+
+# One event loop and one connection pool are shared by every company and set
+# fetched in this process. The loop runs on its own thread so the synchronous
+# code can hand it requests from any worker thread.
+engine_loop = None
+engine_thread = None
+engine_client_session = None
+engine_lock = threading.Lock()
+
+
+def get_engine_loop() -> asyncio.AbstractEventLoop:
+    """gets the event loop of the http engine, starting it on first use
+
+    Returns:
+        asyncio.AbstractEventLoop: running event loop of the engine
+    """
+    global engine_loop, engine_thread
+    with engine_lock:
+        if engine_loop is None:
+            engine_loop = asyncio.new_event_loop()
+            engine_thread = threading.Thread(
+                target=engine_loop.run_forever, name='http-engine', daemon=True)
+            engine_thread.start()
+        return engine_loop
+
+
+async def get_client_session() -> aiohttp.ClientSession:
+    """gets the aiohttp session shared by all the requests of the engine
+
+    Returns:
+        aiohttp.ClientSession: client session bound to the engine loop
+    """
+    global engine_client_session
+    if engine_client_session is None or engine_client_session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=MAX_HTTP_CONNECTIONS, limit_per_host=MAX_REQUESTS_PER_HOST)
+        engine_client_session = aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS))
+    return engine_client_session
+
+
+def load_response(search_type: str, content_type: str, text: str):
+    """turns the text of a search response into what the parsers read
+
+    Args:
+        search_type (str): search type
+        content_type (str): Content-Type header of the response
+        text (str): response text
+
+    Returns:
+        Dict: parsed json response, or the page text for html and plain text responses
+    """
+    if "text/html" in content_type or (search_type == "POST" and "text/plain" in content_type):
+        return text
+    return json.loads(text)
+
+
+def get_cache_key(search_type: str, search_api_url: str, search_api_header: Dict = "",
+                  search_api_extra_header: Dict = "") -> str:
+    """gets the http cache key of a request, POST bodies are hashed as canonical json
+
+    Args:
+        search_type (str): search type
+        search_api_url (str): search api url
+        search_api_header (Dict): search api headers, sent as the json body of POST searches
+        search_api_extra_header (Dict): http headers sent along with POST searches
+
+    Returns:
+        str: sha256 of the canonical request
+    """
+    return hashlib.sha256(get_request_key(search_type, search_api_url, search_api_header,
+                                          search_api_extra_header).encode()).hexdigest()
+
+
+async def run_blocking(function, *args):
+    """runs a blocking function, like a cache query, on a worker thread so the engine loop keeps serving
+
+    Args:
+        function (Callable): blocking function
+        *args: arguments of the function
+
+    Returns:
+        Any: result of the function
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(function, *args))
+
+
+async def read_search_response(req: aiohttp.ClientResponse, search_type: str, request_key: Optional[str],
+                               cached_response: Optional[Dict]):
+    """reads a search response, answering from the http cache when the portal says it didn't change
+
+    Args:
+        req (aiohttp.ClientResponse): response of the portal
+        search_type (str): search type
+        request_key (Optional[str]): http cache key of the request, None when it isn't cached
+        cached_response (Optional[Dict]): cached response sent for revalidation
+
+    Returns:
+        Dict: parsed json response, or the page text for html and plain text responses
+    """
+    logging.info(
+        f'Data fetched from search with response status code: '
+        + str(req.status))
+    if req.status == 304 and cached_response is not None:
+        return load_response(search_type, cached_response['content_type'], cached_response['body'])
+    if search_type == "GET" and not req.headers:
+        return {}
+    content_type = req.headers.get('Content-Type', '')
+    text = await req.text()
+    response = load_response(search_type, content_type, text)
+    if request_key is not None and req.status == 200:
+        etag = req.headers.get('ETag')
+        last_modified = req.headers.get('Last-Modified')
+        if is_cacheable(req.headers.get('Cache-Control', ''), etag, last_modified):
+            await run_blocking(store_response, request_key, text, content_type, etag, last_modified)
+    return response
+
+
+async def fetch_search_url(search_type: str, search_api_url: str, search_api_header: Dict = "",
+                           search_api_extra_header: Dict = ""):
+    """gets the page response from the given search api url
+
+    With HTTP_CACHE_ENABLED a cached response is revalidated with a conditional
+    request and returned when the portal answers 304 Not Modified.
+
+    Args:
+        search_type (str): search type
+        search_api_url (str): search api url
+        search_api_header (Dict): search api headers, sent as the json body of POST searches
+        search_api_extra_header (Dict): http headers sent along with POST searches
+
+    Returns:
+        Dict: parsed json response, or the page text for html and plain text responses
+    """
+    client_session = await get_client_session()
+    request_key = None
+    cached_response = None
+    if HTTP_CACHE_ENABLED:
+        request_key = get_cache_key(search_type, search_api_url, search_api_header, search_api_extra_header)
+        cached_response = await run_blocking(get_cached_response, request_key)
+    conditional_headers = get_conditional_headers(cached_response)
+    if search_type == "POST":
+        request_args = {'json': search_api_header}
+        if search_api_extra_header or conditional_headers:
+            request_args['headers'] = {**(search_api_extra_header or {}), **conditional_headers}
+        async with client_session.post(search_api_url, **request_args) as req:
+            return await read_search_response(req, search_type, request_key, cached_response)
+    request_args = {'headers': conditional_headers} if conditional_headers else {}
+    async with client_session.get(search_api_url, **request_args) as req:
+        return await read_search_response(req, search_type, request_key, cached_response)
+
+
+async def fetch_text(url: str) -> str:
+    """gets the raw text of the given url
+
+    Args:
+        url (str): url of the page
+
+    Returns:
+        str: page text
+    """
+    client_session = await get_client_session()
+    async with client_session.get(url) as req:
+        logging.info(
+            f'Data fetched from {url} with response status code: '
+            + str(req.status))
+        return await req.text()
+
+
+def run_in_engine(coroutine):
+    """runs the coroutine on the engine loop and waits for its result
+
+    Must not be called from the engine loop itself.
+
+    Args:
+        coroutine (Coroutine): coroutine to run
+
+    Returns:
+        Any: result of the coroutine
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, get_engine_loop()).result()
+
+
+# responses of the company being polled by request, so the keywords of a
+# portal whose search doesn't depend on the keyword share a single fetch
+shared_responses_var = contextvars.ContextVar('shared_responses', default=None)
+shared_responses_lock = threading.Lock()
+
+
+def get_request_key(search_type: str, search_api_url: str, search_api_header: Dict = "",
+                    search_api_extra_header: Dict = "") -> str:
+    """gets a key which is the same for every identical request, whatever the order of its header keys
+
+    Args:
+        search_type (str): search type
+        search_api_url (str): search api url
+        search_api_header (Dict): search api headers
+        search_api_extra_header (Dict): http headers sent along with POST searches
+
+    Returns:
+        str: canonical json of the request
+    """
+    return json.dumps([search_type, search_api_url, search_api_header or None, search_api_extra_header or None],
+                      sort_keys=True, separators=(',', ':'), default=str)
+
+
+@contextmanager
+def sharing_responses():
+    """makes the identical requests of get_response_for_search_url within the block share one fetch"""
+    token = shared_responses_var.set({})
+    try:
+        yield
+    finally:
+        shared_responses_var.reset(token)
+
+
+def get_response_for_search_url(search_type: str, search_api_url: str, session, search_api_header: Dict = "",
+                                search_api_extra_header: Dict = "") -> Dict:
+    """gets the page response from the given search api url
+
+    The request goes through the shared engine, async code should await
+    fetch_search_url directly.
+
+    Args:
+        search_type (str): search type
+        search_api_url (str): search api url
+        session (request): session object, kept for compatibility with the parsers
+        search_api_header (Dict): search api headers
+        search_api_extra_header (Dict): http headers sent along with POST searches
+
+    Returns:
+        Dict: parsed json response, or the page text for html and plain text responses
+    """
+    shared_responses = shared_responses_var.get()
+    if shared_responses is None:
+        return run_in_engine(fetch_search_url(search_type, search_api_url, search_api_header,
+                                              search_api_extra_header))
+    request_key = get_request_key(search_type, search_api_url, search_api_header, search_api_extra_header)
+    with shared_responses_lock:
+        shared_response = shared_responses.get(request_key)
+        is_first_request = shared_response is None
+        if is_first_request:
+            shared_response = shared_responses[request_key] = Future()
+    if not is_first_request:
+        # the parsers only read the responses, so the same object is handed out
+        return shared_response.result()
+    try:
+        response = run_in_engine(fetch_search_url(search_type, search_api_url, search_api_header,
+                                                  search_api_extra_header))
+    except BaseException as e:
+        shared_response.set_exception(e)
+        raise
+    shared_response.set_result(response)
+    return response
+
+
+def get_responses_for_search_urls(search_requests: List[tuple]) -> List:
+    """gets the responses of several search requests concurrently
+
+    Args:
+        search_requests (List[tuple]): (search type, search api url, search api header,
+            search api extra header) for every request
+
+    Returns:
+        List: responses in the same order as the requests
+    """
+    async def fetch_all():
+        return await asyncio.gather(*[fetch_search_url(*search_request) for search_request in search_requests])
+    return run_in_engine(fetch_all())
+
+
+def close_engine():
+    """closes the shared connection pool and stops the engine loop"""
+    global engine_loop, engine_thread, engine_client_session
+    with engine_lock:
+        if engine_loop is None:
+            return
+        if engine_client_session is not None:
+            asyncio.run_coroutine_threadsafe(
+                engine_client_session.close(), engine_loop).result()
+        engine_loop.call_soon_threadsafe(engine_loop.stop)
+        engine_thread.join()
+        engine_loop.close()
+        engine_loop = None
+        engine_thread = None
+        engine_client_session = None
@@ -0,0 +1,18 @@
+from datetime import date, datetime
+from functools import lru_cache
+
+from constants import POSTED_DATE_CACHE_SIZE
+
+
+@lru_cache(maxsize=POSTED_DATE_CACHE_SIZE)
+def parse_posted_date(date_text: str, date_format: str) -> date:
+    """parses the posted date of a job, every keyword search returning the job reuses the first parse
+
+    Args:
+        date_text (str): posted date as written by the portal
+        date_format (str): strptime format of the portal
+
+    Returns:
+        date: posted date
+    """
+    return datetime.strptime(date_text, date_format).date()
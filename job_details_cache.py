@@ -0,0 +1,75 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from constants import JOB_DETAILS_DB, JOB_DETAILS_TTL_DAYS, JOB_DETAILS_MAX_ENTRIES, \
+    JOB_DETAILS_EVICT_INTERVAL_HOURS
+from sqlite_cache import new_sqlite_cache, open_sqlite_cache, evict_sqlite_cache_if_due, close_sqlite_cache
+
+
+def evict_job_details(connection: sqlite3.Connection) -> int:
+    """drops the expired entries and the oldest ones above JOB_DETAILS_MAX_ENTRIES
+
+    Args:
+        connection (sqlite3.Connection): job details database
+
+    Returns:
+        int: number of dropped entries
+    """
+    expired_before = datetime.now() - timedelta(days=JOB_DETAILS_TTL_DAYS)
+    dropped_entries = connection.execute('DELETE FROM job_details WHERE fetched < ?',
+                                         (expired_before.isoformat(timespec='seconds'),)).rowcount
+    dropped_entries += connection.execute('''DELETE FROM job_details WHERE job_url IN (
+                                                 SELECT job_url FROM job_details ORDER BY fetched DESC
+                                                 LIMIT -1 OFFSET ?)''', (JOB_DETAILS_MAX_ENTRIES,)).rowcount
+    return dropped_entries
+
+
+# The details a parser reads from a job page, like its posted date and
+# location, never change while the job is listed. They are kept in one
+# database shared by all the sets, so a job page is only downloaded again
+# once its entry is older than JOB_DETAILS_TTL_DAYS or was evicted to keep
+# the cache under JOB_DETAILS_MAX_ENTRIES.
+job_details_cache = new_sqlite_cache(JOB_DETAILS_DB, 1, [
+    '''CREATE TABLE IF NOT EXISTS job_details (
+           job_url TEXT PRIMARY KEY,
+           details TEXT NOT NULL,
+           fetched TEXT NOT NULL)''',
+    'CREATE INDEX IF NOT EXISTS job_details_fetched ON job_details (fetched)'],
+    evict_job_details, timedelta(hours=JOB_DETAILS_EVICT_INTERVAL_HOURS))
+
+
+def get_job_details(job_url: str, fetch_job_details: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+    """gets the details of a job page from the cache, fetching and caching them on a miss
+
+    Args:
+        job_url (str): url of the job page
+        fetch_job_details (Callable[[], Optional[Dict]]): downloads the job page and extracts
+            its details as json serializable values, None when the page has none
+
+    Returns:
+        Optional[Dict]: job details, None when the page has none
+    """
+    connection = open_sqlite_cache(job_details_cache)
+    fresh_after = datetime.now() - timedelta(days=JOB_DETAILS_TTL_DAYS)
+    with job_details_cache['lock']:
+        row = connection.execute('SELECT details FROM job_details WHERE job_url = ? AND fetched >= ?',
+                                 (job_url, fresh_after.isoformat(timespec='seconds'))).fetchone()
+    if row:
+        return json.loads(row[0])
+    job_details = fetch_job_details()
+    if job_details is None:
+        # pages without details are asked again, they may be filled in later
+        return None
+    with job_details_cache['lock']:
+        connection.execute('INSERT OR REPLACE INTO job_details (job_url, details, fetched) VALUES (?, ?, ?)',
+                           (job_url, json.dumps(job_details), datetime.now().isoformat(timespec='seconds')))
+        connection.commit()
+        evict_sqlite_cache_if_due(job_details_cache)
+    return job_details
+
+
+def close_job_details_cache():
+    """closes the job details database"""
+    close_sqlite_cache(job_details_cache)
@@ -0,0 +1,213 @@
+import csv
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Set
+
+from constants import COMPANY_KNOWN_JOBS_CSV, COMPANY_KNOWN_JOBS_DB, IMPORTED_CSV_SUFFIX, DAYS_TO_CHECK, \
+    KNOWN_JOBS_RETENTION_DAYS, KNOWN_JOBS_PRUNE_INTERVAL_HOURS, ARRIVAL_RATE_HALF_LIFE_HOURS, \
+    POLL_TARGET_NEW_JOBS, COMPANY_POLL_INTERVAL_MINUTES
+
+KNOWN_JOBS_SCHEMA_VERSION = 4
+
+
+def open_known_jobs_store(csv_folder_location: str) -> sqlite3.Connection:
+    """opens the known jobs database of a set, creating it on first use
+
+    The first time a set is opened its already_known_jobs.csv is imported as a
+    seed and renamed to already_known_jobs.csv.imported once the import is
+    committed, so a lost database doesn't bring back the stale job ids. The
+    database runs in write ahead log mode, so every commit is a small append
+    that survives the process being killed, and a half written transaction is
+    rolled back on the next open.
+
+    Args:
+        csv_folder_location (str): folder of the set's csv files
+
+    Returns:
+        sqlite3.Connection: connection to the set's known jobs database
+    """
+    connection = sqlite3.connect(os.path.join(
+        csv_folder_location, COMPANY_KNOWN_JOBS_DB))
+    connection.execute('PRAGMA journal_mode = WAL')
+    connection.execute('PRAGMA synchronous = NORMAL')
+    schema_version = connection.execute('PRAGMA user_version').fetchone()[0]
+    if schema_version < 1:
+        connection.execute('''CREATE TABLE IF NOT EXISTS known_jobs (
+                                  company_id TEXT NOT NULL,
+                                  job_id TEXT NOT NULL,
+                                  first_seen TEXT NOT NULL,
+                                  last_seen TEXT NOT NULL,
+                                  PRIMARY KEY (company_id, job_id)) WITHOUT ROWID''')
+        import_known_jobs_csv(connection, csv_folder_location)
+    elif schema_version < 2:
+        connection.execute('ALTER TABLE known_jobs ADD COLUMN last_seen TEXT')
+        connection.execute('UPDATE known_jobs SET last_seen = first_seen')
+    if schema_version < 2:
+        connection.execute(
+            'CREATE INDEX IF NOT EXISTS known_jobs_last_seen ON known_jobs (last_seen)')
+        connection.execute('''CREATE TABLE IF NOT EXISTS store_metadata (
+                                  key TEXT PRIMARY KEY,
+                                  value TEXT NOT NULL)''')
+    if schema_version < 3:
+        connection.execute('''CREATE TABLE IF NOT EXISTS company_polls (
+                                  company_id TEXT PRIMARY KEY,
+                                  last_polled TEXT NOT NULL,
+                                  arrival_rate REAL)''')
+    elif schema_version < 4:
+        # the rates were seeded from a single poll, mostly 0, start them again from the prior
+        connection.execute('UPDATE company_polls SET arrival_rate = NULL')
+    if schema_version < KNOWN_JOBS_SCHEMA_VERSION:
+        connection.execute(f'PRAGMA user_version = {KNOWN_JOBS_SCHEMA_VERSION}')
+        connection.commit()
+    # the csv of a set migrated by an earlier version is retired here as well
+    retire_known_jobs_csv(csv_folder_location)
+    return connection
+
+
+def import_known_jobs_csv(connection: sqlite3.Connection, csv_folder_location: str):
+    """imports the pipe joined job ids of already_known_jobs.csv into the database
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        csv_folder_location (str): folder of the set's csv files
+    """
+    known_jobs_csv = os.path.join(csv_folder_location, COMPANY_KNOWN_JOBS_CSV)
+    if not os.path.exists(known_jobs_csv):
+        return
+    with open(known_jobs_csv, newline='') as company_known_csvfile:
+        reader = csv.DictReader(company_known_csvfile)
+        for row in reader:
+            add_known_jobs(connection, row['CompanyID'],
+                           row['KnownJobs'].split('|'))
+    logging.info(f'Imported the known jobs from {known_jobs_csv}.')
+
+
+def retire_known_jobs_csv(csv_folder_location: str):
+    """renames the imported already_known_jobs.csv, the database is the only record from now on
+
+    Args:
+        csv_folder_location (str): folder of the set's csv files
+    """
+    known_jobs_csv = os.path.join(csv_folder_location, COMPANY_KNOWN_JOBS_CSV)
+    if os.path.exists(known_jobs_csv):
+        os.replace(known_jobs_csv, known_jobs_csv + IMPORTED_CSV_SUFFIX)
+        logging.info(f'Renamed {known_jobs_csv}, the known jobs now live in {COMPANY_KNOWN_JOBS_DB}.')
+
+
+def get_known_jobs(connection: sqlite3.Connection, company_id: str) -> Set[str]:
+    """gets the already notified job ids of a company
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        company_id (str): company id
+
+    Returns:
+        Set[str]: known job ids
+    """
+    rows = connection.execute(
+        'SELECT job_id FROM known_jobs WHERE company_id = ?', (company_id,))
+    return {row[0] for row in rows}
+
+
+def add_known_jobs(connection: sqlite3.Connection, company_id: str, job_ids: Iterable[str]):
+    """adds the notified job ids of a company and refreshes the last seen time of the known ones
+
+    Job ids already stored keep their first seen time.
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        company_id (str): company id
+        job_ids (Iterable[str]): job ids found in this run
+    """
+    seen = datetime.now().isoformat(timespec='seconds')
+    connection.executemany('''INSERT INTO known_jobs (company_id, job_id, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                              ON CONFLICT (company_id, job_id) DO UPDATE SET last_seen = excluded.last_seen''',
+                           [(company_id, str(job_id), seen, seen) for job_id in job_ids if job_id])
+
+
+def prune_known_jobs(connection: sqlite3.Connection, retention_days: int = KNOWN_JOBS_RETENTION_DAYS) -> int:
+    """drops the job ids which were not seen for more than the retention period
+
+    A job that the parsers stopped returning is older than DAYS_TO_CHECK, so it
+    can never be notified again. Jobs without a posted date are returned on every
+    run and keep a fresh last seen time. Pruning runs at most once every
+    KNOWN_JOBS_PRUNE_INTERVAL_HOURS.
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        retention_days (int): days a job id is kept after it was last seen, never less than DAYS_TO_CHECK
+
+    Returns:
+        int: number of dropped job ids
+    """
+    now = datetime.now()
+    row = connection.execute(
+        "SELECT value FROM store_metadata WHERE key = 'last_pruned'").fetchone()
+    if row and now - datetime.fromisoformat(row[0]) < timedelta(hours=KNOWN_JOBS_PRUNE_INTERVAL_HOURS):
+        return 0
+    horizon = now - timedelta(days=max(retention_days, DAYS_TO_CHECK + 1))
+    dropped_jobs = connection.execute('DELETE FROM known_jobs WHERE last_seen < ?',
+                                      (horizon.isoformat(timespec='seconds'),)).rowcount
+    connection.execute("INSERT OR REPLACE INTO store_metadata (key, value) VALUES ('last_pruned', ?)",
+                       (now.isoformat(timespec='seconds'),))
+    connection.commit()
+    if dropped_jobs > 0:
+        # give the freed pages back so the file stays small
+        connection.execute('VACUUM')
+    logging.info(
+        f'Pruned {dropped_jobs} known jobs not seen since {horizon.date()}.')
+    return dropped_jobs
+
+
+def record_company_poll(connection: sqlite3.Connection, company_id: str, new_jobs: int) -> Optional[float]:
+    """updates the new job arrival rate of a company with the outcome of a poll
+
+    The rate is a moving average of the new jobs per hour which forgets half of
+    its history every ARRIVAL_RATE_HALF_LIFE_HOURS, so it follows the company's
+    posting cadence whatever the polling interval was. The first poll of a
+    company only records its time, every listed job is new to it. The average
+    starts from the rate expecting POLL_TARGET_NEW_JOBS per default polling
+    interval, so a few quiet polls don't make a company look dead.
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        company_id (str): company id
+        new_jobs (int): number of jobs notified by the poll
+
+    Returns:
+        Optional[float]: new jobs per hour, None until the company was polled twice
+    """
+    now = datetime.now()
+    row = connection.execute('SELECT last_polled, arrival_rate FROM company_polls WHERE company_id = ?',
+                             (company_id,)).fetchone()
+    arrival_rate = None
+    if row:
+        last_polled, arrival_rate = datetime.fromisoformat(row[0]), row[1]
+        elapsed_hours = (now - last_polled).total_seconds() / 3600
+        if elapsed_hours > 0:
+            observed_rate = new_jobs / elapsed_hours
+            if arrival_rate is None:
+                arrival_rate = POLL_TARGET_NEW_JOBS * 60 / COMPANY_POLL_INTERVAL_MINUTES
+            weight = 1 - 0.5 ** (elapsed_hours / ARRIVAL_RATE_HALF_LIFE_HOURS)
+            arrival_rate += weight * (observed_rate - arrival_rate)
+    connection.execute('INSERT OR REPLACE INTO company_polls (company_id, last_polled, arrival_rate) VALUES (?, ?, ?)',
+                       (company_id, now.isoformat(timespec='seconds'), arrival_rate))
+    connection.commit()
+    return arrival_rate
+
+
+def get_arrival_rate(connection: sqlite3.Connection, company_id: str) -> Optional[float]:
+    """gets the new job arrival rate of a company
+
+    Args:
+        connection (sqlite3.Connection): known jobs database
+        company_id (str): company id
+
+    Returns:
+        Optional[float]: new jobs per hour, None until the company was polled twice
+    """
+    row = connection.execute('SELECT arrival_rate FROM company_polls WHERE company_id = ?',
+                             (company_id,)).fetchone()
+    return row[0] if row else None
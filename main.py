@@ -1,6 +1,13 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+import heapq
 import json
-from typing import Dict
+from logging.handlers import RotatingFileHandler
+import random
+import signal
+import threading
+import time
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import logging
 import csv
@@ -12,23 +19,34 @@ import sys
 from constants import DATA_FOLDER_LOCATION, COMPANY_NAMES_CSV, \
     COMPANY_SEARCH_API_HEADER_CSV, \
     COMPANY_KEYWORDS_CSV, COMPANY_SEARCH_API_CSV, \
-    COMPANY_STATUS_CSV, COMPANY_SEARCH_API_EXTRA_HEADER_CSV,\
-    COMPANY_KNOWN_JOBS_CSV, LOG_FILE_NAME,\
-    SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK_VAR,\
-    SLACK_ERROR_NOTIFICATION_WEBHOOK_VAR,\
-    SLACK_JOB_NOTIFICATION_WEBHOOK_VAR,\
-    LOG_FOLDER_LOCATION
+    COMPANY_STATUS_CSV, COMPANY_SEARCH_API_EXTRA_HEADER_CSV, COMPANY_PORTAL_PARAMS_CSV,\
+    LOG_FILE_NAME,\
+    LOG_FOLDER_LOCATION, MAX_COMPANY_WORKERS, COMPANY_POLL_INTERVAL_MINUTES, COMPANY_POLL_JITTER_RATIO, \
+    COMPANY_POLL_MAX_BACKOFF_MINUTES, ADAPTIVE_POLLING, POLL_TARGET_NEW_JOBS, MIN_COMPANY_POLL_INTERVAL_MINUTES, \
+    MAX_COMPANY_POLL_INTERVAL_MINUTES, MAX_POLL_INTERVAL_GROWTH, DAEMON_RELOAD_CHECK_SECONDS, DAEMON_LOG_FOLDER_NAME, \
+    DAEMON_LOG_MAX_BYTES, DAEMON_LOG_BACKUP_COUNT, SLACK_OUTBOX_RESEND_AFTER_SECONDS
+from http_cache import close_http_cache
+from http_engine import close_engine
+from job_details_cache import close_job_details_cache
 from job_checker import get_relevant_jobs
+from known_jobs_store import open_known_jobs_store, get_known_jobs, add_known_jobs, prune_known_jobs, \
+    record_company_poll, get_arrival_rate
+from title_filter import get_terms_to_ignore, ignoring_terms, matching_keywords
+from notifier import start_notifier, notify_new_jobs, close_notifier, \
+    send_deployment_notification_to_user, send_error_notification_to_user, queue_outbox_messages
 
 def get_company_data(csv_folder_location):
     company_info = {}
+    terms_to_ignore = get_terms_to_ignore(csv_folder_location)
     # Get company names and their IDs
     with open(os.path.join(csv_folder_location, COMPANY_NAMES_CSV), newline='') as company_name_csvfile:
         reader = csv.DictReader(company_name_csvfile)
         for row in reader:
             company_info[row['CompanyID']] = {
                 'CompanyName': row['CompanyName'],
-                'CompanyPortal': row['CompanyPortal']}
+                'CompanyPortal': row['CompanyPortal'],
+                'PortalParams': {},
+                'TermsToIgnore': terms_to_ignore}
     # Get company related keywords
     with open(os.path.join(csv_folder_location, COMPANY_KEYWORDS_CSV), newline='') as company_keywords_csvfile:
         reader = csv.DictReader(company_keywords_csvfile)
@@ -65,172 +83,455 @@ def get_company_data(csv_folder_location):
             else:
                 company_info[row['CompanyID']].update({
                     'SearchExtraHeader': json.loads(row['SearchExtraHeader'])})
-    # Get company known jobs
-    with open(os.path.join(csv_folder_location, COMPANY_KNOWN_JOBS_CSV), newline='') as company_known_csvfile:
-        reader = csv.DictReader(company_known_csvfile)
-        for row in reader:
-            company_info[row['CompanyID']].update(
-                {'KnownJobs': row['KnownJobs']})
-    # Get monitored company status
+    # Get company portal adapter params, like the workday apply link prefix
+    company_portal_params_csv = os.path.join(csv_folder_location, COMPANY_PORTAL_PARAMS_CSV)
+    if os.path.exists(company_portal_params_csv):
+        with open(company_portal_params_csv, newline='') as company_portal_params_csvfile:
+            reader = csv.DictReader(company_portal_params_csvfile, delimiter='|')
+            for row in reader:
+                if row['PortalParams'] != "":
+                    company_info[row['CompanyID']].update({
+                        'PortalParams': json.loads(row['PortalParams'])})
+    # Get monitored company status and its polling interval in daemon mode
     with open(os.path.join(csv_folder_location, COMPANY_STATUS_CSV), newline='') as company_status_csvfile:
         reader = csv.DictReader(company_status_csvfile)
         for row in reader:
             company_info[row['CompanyID']].update(
-                {'MonitorStatus': row['MonitorStatus']})
+                {'MonitorStatus': row['MonitorStatus'],
+                 'PollIntervalMinutes': float(row['PollIntervalMinutes']) if row.get('PollIntervalMinutes') else None})
     return company_info
 
 
-def send_deployment_notification_to_user(notification_type: str,
-                                         notification_message: str, session):
-    """sends the deployment notification to user
+def get_relevant_jobs_for_company(company_data: Dict, session) -> Dict:
+    """gets the relevant jobs for a single monitored company
 
     Args:
-        notification_type (str): notification type
-        notification_message (str): notification message
+        company_data (Dict): company information loaded from the set's csv files
         session (request): session for the url
+
+    Returns:
+        Dict: relevant jobs where key is jobID and value is jobInformation
     """
-    req = session.post(url=os.getenv(SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK_VAR),
-                       headers={
-                           'Content-type': 'application/json'},
-                       json={'text': f'Deployment Message: {notification_type} - {notification_message}'})
-    logging.info(
-        'Notification sent to deployment with response status code: '
-        + str(req.status_code))
+    with ignoring_terms(company_data['TermsToIgnore']), matching_keywords(company_data['Keywords']):
+        return get_relevant_jobs(company_data['CompanyName'], company_data['CompanyPortal'],
+                                 company_data['SearchType'], company_data['SearchAPI'],
+                                 company_data['Keywords'], company_data['SearchHeader'],
+                                 company_data['SearchExtraHeader'], session, company_data['PortalParams'])
 
 
-def send_error_notification_to_user(notification_message: str, session):
-    """sends the error notification to user
+def update_known_jobs(known_jobs_store, company_name: str):
+    """saves the known jobs of a finished company in the known jobs database
 
     Args:
-        notification_message (str): notification message
-        session (_type_): session for the requested url
+        known_jobs_store (sqlite3.Connection): known jobs database of the set
+        company_name (str): company name
     """
-    req = session.post(url=os.getenv(SLACK_ERROR_NOTIFICATION_WEBHOOK_VAR),
-                       headers={
-                           'Content-type': 'application/json'},
-                       json={'text': f'Error Message: ERROR - {notification_message}'})
-    logging.info(
-        'Error notification sent to deployment with response status code: '
-        + str(req.status_code))
+    known_jobs_store.commit()
+    logging.info(f'Updated the known jobs database for {company_name}.')
 
 
-def send_notification_to_user(company_name: str, job_id: str,
-                              job_title: str, job_posted_date: str,
-                              job_application_link: str, session):
-    """sends the notification to the user for the company position with details
+def notify_new_jobs_of_company(known_jobs_store, company_id: str, company_name: str, relevant_jobs: Dict) -> int:
+    """notifies the relevant jobs of a company which were not notified yet and saves them as known
 
     Args:
+        known_jobs_store (sqlite3.Connection): known jobs database of the set
+        company_id (str): company id
         company_name (str): company name
-        job_id (str): job id
-        job_title (str): job title
-        job_posted_date (str): job creation date
-        job_application_link (str): job application link
-        session (request): session for the url
+        relevant_jobs (Dict): relevant jobs where key is jobID and value is jobInformation
+
+    Returns:
+        int: number of new jobs
     """
-    req = session.post(url=os.getenv(SLACK_JOB_NOTIFICATION_WEBHOOK_VAR),
-                       headers={
-                           'Content-type': 'application/json'},
-                       json={
-                           'text': f'Company Name: *{company_name}*\nJob Id: *{job_id}*\nJob Title: *{job_title}*\nPosted Date: *{job_posted_date.strftime("%m/%d/%Y")}*\nApply: <{job_application_link}>\n----------\n'
-    }
-    )
-    logging.info(
-        'notification sent to deployment with response status code: '
-        + str(req.status_code))
+    if len(relevant_jobs) < 1:
+        return 0
+    known_jobs = get_known_jobs(known_jobs_store, company_id)
+    new_jobs = []
+    for job_id in relevant_jobs:
+        # If job not present in the already notified list,
+        # notify it to the user, add that job id to already notified list
+        if str(job_id) not in known_jobs:
+            job_title = relevant_jobs[job_id]['title']
+            job_posted_date = relevant_jobs[job_id]['posted_date']
+            logging.info(
+                f'New job found: {job_title} posted on : {job_posted_date} for company:{company_name}. Notifying user ...')
+            new_jobs.append({'job_id': job_id, **relevant_jobs[job_id]})
+            known_jobs.add(str(job_id))
+    # queue the notifications and save the job ids right away,
+    # so a run killed later on doesn't notify them again
+    notify_new_jobs(company_name, new_jobs)
+    # keep the still listed job ids from being pruned
+    add_known_jobs(known_jobs_store, company_id, relevant_jobs.keys())
+    update_known_jobs(known_jobs_store, company_name)
+    return len(new_jobs)
 
 
-def update_known_jobs(company_info: Dict[str, str], csv_folder_location):
-    """updated the newly found known job in the csv file
+def get_set_names(set_arguments: List[str]) -> List[str]:
+    """gets the sets to run from the command line arguments
 
     Args:
-        company_info (Dict[str,str]): company name and its new job ids
+        set_arguments (List[str]): set names (Eg: set-1 set-3), or "all" for every set in the data folder
+
+    Returns:
+        List[str]: set names in the order they are run
     """
-    with open(os.path.join(csv_folder_location, COMPANY_KNOWN_JOBS_CSV), 'w', newline='') as company_known_csvfile:
-        # create the csv writer
-        writer = csv.writer(company_known_csvfile)
-        # write a row to the csv file
-        writer.writerow(['CompanyID', 'KnownJobs'])
-        for company_id in company_info:
-            company_data = company_info[company_id]
-            writer.writerow([company_id, company_data['KnownJobs']])
-    logging.info('Updated the known jobs file.')
+    if set_arguments == ['all']:
+        set_names = [folder_name for folder_name in os.listdir(DATA_FOLDER_LOCATION)
+                     if folder_name.startswith('set-') and os.path.isdir(os.path.join(DATA_FOLDER_LOCATION, folder_name))]
+        return sorted(set_names, key=lambda set_name: int(set_name.split('-')[1]))
+    return set_arguments
 
 
-def main():
-    set_name = sys.argv[1]
-    if not set_name:
-        print("Error, set name needed. Please provide set[1-12]. Eg: set-1")
-        return
+def start_set_log(set_name: str) -> logging.Handler:
+    """sends the log records to the set's log file until stop_set_log is called
+
+    Args:
+        set_name (str): set name
+
+    Returns:
+        logging.Handler: file handler of the set's log
+    """
     set_log_folder = os.path.join(LOG_FOLDER_LOCATION, set_name)
     if not os.path.exists(set_log_folder):
         os.makedirs(set_log_folder, exist_ok=True)
-    logging.basicConfig(filename=os.path.join(set_log_folder, LOG_FILE_NAME),
-                        level=logging.DEBUG, filemode='w')
+    set_log_handler = logging.FileHandler(os.path.join(set_log_folder, LOG_FILE_NAME), mode='w')
+    set_log_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    logging.getLogger().addHandler(set_log_handler)
+    return set_log_handler
+
+
+def stop_set_log(set_log_handler: logging.Handler):
+    """stops sending the log records to the set's log file
+
+    Args:
+        set_log_handler (logging.Handler): file handler of the set's log
+    """
+    logging.getLogger().removeHandler(set_log_handler)
+    set_log_handler.close()
+
+
+def check_set(set_name: str, session):
+    """checks every enabled company of a set and notifies the new jobs
+
+    Args:
+        set_name (str): set name
+        session (request): session for the url
+    """
+    # -- Already Known Stuff --
+    company_info = get_company_data(os.path.join(DATA_FOLDER_LOCATION, set_name))
+    known_jobs_store = open_known_jobs_store(os.path.join(DATA_FOLDER_LOCATION, set_name))
+    try:
+        prune_known_jobs(known_jobs_store)
+        # -- Fetching New Data --
+        enabled_company_ids = []
+        for company_id in company_info:
+            company_name = company_info[company_id]['CompanyName']
+            monitor_status = company_info[company_id]['MonitorStatus']
+            if monitor_status != 'Enabled':
+                logging.info(
+                    f"Bypassing {company_name} as information not available")
+                continue
+            enabled_company_ids.append(company_id)
+        # Fetch the companies in parallel, but notify and merge the known
+        # jobs from this thread only so the known job list stays consistent
+        with ThreadPoolExecutor(max_workers=MAX_COMPANY_WORKERS) as executor:
+            future_to_company_id = {
+                executor.submit(get_relevant_jobs_for_company, company_info[company_id], session): company_id
+                for company_id in enabled_company_ids}
+            try:
+                for future in as_completed(future_to_company_id):
+                    company_id = future_to_company_id[future]
+                    company_name = company_info[company_id]['CompanyName']
+                    new_job_count = notify_new_jobs_of_company(
+                        known_jobs_store, company_id, company_name, future.result())
+                    record_company_poll(known_jobs_store, company_id, new_job_count)
+            except Exception:
+                # don't start the companies which are still waiting in the queue
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+    finally:
+        known_jobs_store.close()
+    logging.info('All new jobs notified to the user.')
+
+
+def get_set_modified_time(set_name: str) -> float:
+    """gets the last modification time of the set's csv files
+
+    Args:
+        set_name (str): set name
+
+    Returns:
+        float: modification time of the most recently changed csv file
+    """
+    set_folder_location = os.path.join(DATA_FOLDER_LOCATION, set_name)
+    return max(os.path.getmtime(os.path.join(set_folder_location, file_name))
+               for file_name in os.listdir(set_folder_location) if file_name.endswith('.csv'))
+
+
+def get_adaptive_poll_interval(arrival_rate: Optional[float], previous_interval: Optional[float] = None) -> float:
+    """gets the polling interval expecting POLL_TARGET_NEW_JOBS new jobs per poll
+
+    The interval grows by at most MAX_POLL_INTERVAL_GROWTH times the previous
+    one, so a quiet spell lengthens it step by step. It shrinks at once.
+
+    Args:
+        arrival_rate (Optional[float]): new jobs per hour of the company, None when not known yet
+        previous_interval (Optional[float]): previous polling interval in minutes, None for the first one
+
+    Returns:
+        float: polling interval in minutes, between the MIN and MAX polling intervals
+    """
+    if not ADAPTIVE_POLLING or arrival_rate is None:
+        return COMPANY_POLL_INTERVAL_MINUTES
+    if arrival_rate <= 0:
+        poll_interval = MAX_COMPANY_POLL_INTERVAL_MINUTES
+    else:
+        poll_interval = min(max(POLL_TARGET_NEW_JOBS / arrival_rate * 60, MIN_COMPANY_POLL_INTERVAL_MINUTES),
+                            MAX_COMPANY_POLL_INTERVAL_MINUTES)
+    return min(poll_interval, (previous_interval or COMPANY_POLL_INTERVAL_MINUTES) * MAX_POLL_INTERVAL_GROWTH)
+
+
+def get_poll_delay(poll_interval: float, failures: int) -> float:
+    """gets the time until the next poll of a company
+
+    The polling interval is doubled for every failed poll in a row, up to
+    COMPANY_POLL_MAX_BACKOFF_MINUTES, and shifted by a random jitter so the
+    companies of a set don't keep hitting their portals together.
+
+    Args:
+        poll_interval (float): polling interval of the company in minutes
+        failures (int): number of failed polls in a row
+
+    Returns:
+        float: seconds until the next poll
+    """
+    if failures > 0:
+        poll_interval = min(poll_interval * 2 ** failures,
+                            max(poll_interval, COMPANY_POLL_MAX_BACKOFF_MINUTES))
+    jitter = random.uniform(-COMPANY_POLL_JITTER_RATIO, COMPANY_POLL_JITTER_RATIO)
+    return poll_interval * 60 * (1 + jitter)
+
+
+def start_daemon_log() -> logging.Handler:
+    """sends the log records of the daemon to its own rotating log file
+
+    Returns:
+        logging.Handler: file handler of the daemon log
+    """
+    daemon_log_folder = os.path.join(LOG_FOLDER_LOCATION, DAEMON_LOG_FOLDER_NAME)
+    if not os.path.exists(daemon_log_folder):
+        os.makedirs(daemon_log_folder, exist_ok=True)
+    daemon_log_handler = RotatingFileHandler(os.path.join(daemon_log_folder, LOG_FILE_NAME),
+                                             maxBytes=DAEMON_LOG_MAX_BYTES, backupCount=DAEMON_LOG_BACKUP_COUNT)
+    daemon_log_handler.setFormatter(logging.Formatter(
+        '%(asctime)s:' + logging.BASIC_FORMAT))
+    logging.getLogger().addHandler(daemon_log_handler)
+    return daemon_log_handler
+
+
+def run_daemon(set_names: List[str], session):
+    """polls every enabled company of the sets on its own interval until SIGINT or SIGTERM
+
+    The session, http engine, notifier and known jobs databases stay open for
+    the whole run, and the outbox is read again every
+    SLACK_OUTBOX_RESEND_AFTER_SECONDS for the messages a slack outage left
+    behind. The csv files of a set are read again once they change, so a
+    company can be disabled, enabled or given another interval without
+    restarting the daemon. Polls running when the daemon is stopped finish and
+    get notified first.
+
+    Args:
+        set_names (List[str]): set names
+        session (request): session for the url
+    """
+    stop_event = threading.Event()
+
+    def stop(signal_number, frame):
+        logging.info(
+            f'Received signal {signal_number}, stopping after the running polls ...')
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    company_infos = {}
+    set_modified_times = {}
+    known_jobs_stores = {}
+    # heap of (due time, set name, company id), an entry is stale once
+    # next_polls holds another due time for the company
+    poll_schedule = []
+    next_polls = {}
+    failed_polls = {}
+    poll_intervals = {}
+    future_to_company = {}
+
+    def schedule_poll(set_name, company_id, due_time):
+        next_polls[(set_name, company_id)] = due_time
+        heapq.heappush(poll_schedule, (due_time, set_name, company_id))
+
+    def schedule_new_companies(set_name):
+        running_companies = {(running_set_name, company_id)
+                             for running_set_name, company_id in future_to_company.values()}
+        for company_id, company_data in company_infos[set_name].items():
+            company = (set_name, company_id)
+            if company_data['MonitorStatus'] == 'Enabled' and company not in next_polls \
+                    and company not in running_companies:
+                schedule_poll(set_name, company_id, time.monotonic())
+
+    def finish_poll(future):
+        set_name, company_id = future_to_company.pop(future)
+        company = (set_name, company_id)
+        company_data = company_infos[set_name].get(company_id)
+        if company_data is None:
+            # the company was removed from the set while it was polled
+            return
+        company_name = company_data['CompanyName']
+        known_jobs_store = known_jobs_stores[set_name]
+        try:
+            new_job_count = notify_new_jobs_of_company(known_jobs_store, company_id, company_name, future.result())
+            record_company_poll(known_jobs_store, company_id, new_job_count)
+            failed_polls.pop(company, None)
+        except Exception as e:
+            failed_polls[company] = failed_polls.get(company, 0) + 1
+            logging.error(f'Error occurred for {company_name} of {set_name}: {e}')
+            # only the first failure of a row is sent, the retries back off
+            if failed_polls[company] == 1:
+                current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                send_error_notification_to_user(
+                    f"{set_name} - {company_name} - {current_date_time} - {traceback.format_exc()}")
+        if company_data['MonitorStatus'] == 'Enabled':
+            arrival_rate = get_arrival_rate(known_jobs_store, company_id)
+            # the company's own polling interval, or the one adapted to its arrival rate
+            poll_intervals[company] = company_data.get('PollIntervalMinutes') or \
+                get_adaptive_poll_interval(arrival_rate, poll_intervals.get(company))
+            poll_delay = get_poll_delay(poll_intervals[company], failed_polls.get(company, 0))
+            arrival_rate_text = f'{arrival_rate:.2f}' if arrival_rate is not None else 'unknown'
+            logging.info(f'Next poll of {company_name} in {poll_delay / 60:.1f} minutes '
+                         f'({arrival_rate_text} new jobs per hour).')
+            schedule_poll(set_name, company_id, time.monotonic() + poll_delay)
+
+    try:
+        for set_name in set_names:
+            set_modified_times[set_name] = get_set_modified_time(set_name)
+            company_infos[set_name] = get_company_data(os.path.join(DATA_FOLDER_LOCATION, set_name))
+            known_jobs_stores[set_name] = open_known_jobs_store(os.path.join(DATA_FOLDER_LOCATION, set_name))
+            schedule_new_companies(set_name)
+        next_reload_check = time.monotonic()
+        next_outbox_check = time.monotonic() + SLACK_OUTBOX_RESEND_AFTER_SECONDS
+        with ThreadPoolExecutor(max_workers=MAX_COMPANY_WORKERS) as executor:
+            while not stop_event.is_set():
+                now = time.monotonic()
+                if now >= next_reload_check:
+                    for set_name in set_names:
+                        prune_known_jobs(known_jobs_stores[set_name])
+                        set_modified_time = get_set_modified_time(set_name)
+                        if set_modified_time == set_modified_times[set_name]:
+                            continue
+                        set_modified_times[set_name] = set_modified_time
+                        try:
+                            company_infos[set_name] = get_company_data(
+                                os.path.join(DATA_FOLDER_LOCATION, set_name))
+                        except Exception as e:
+                            logging.error(f'Could not reload {set_name}, keeping its previous data: {e}')
+                            continue
+                        logging.info(f'Reloaded the company data of {set_name}.')
+                        schedule_new_companies(set_name)
+                    next_reload_check = now + DAEMON_RELOAD_CHECK_SECONDS
+                if now >= next_outbox_check:
+                    queue_outbox_messages()
+                    next_outbox_check = now + SLACK_OUTBOX_RESEND_AFTER_SECONDS
+                while poll_schedule and poll_schedule[0][0] <= now:
+                    due_time, set_name, company_id = heapq.heappop(poll_schedule)
+                    if next_polls.get((set_name, company_id)) != due_time:
+                        continue
+                    del next_polls[(set_name, company_id)]
+                    company_data = company_infos[set_name].get(company_id)
+                    if company_data is None or company_data['MonitorStatus'] != 'Enabled':
+                        # it is scheduled again once the set enables it
+                        continue
+                    logging.info(f"Polling {company_data['CompanyName']} of {set_name} ...")
+                    future = executor.submit(get_relevant_jobs_for_company, company_data, session)
+                    future_to_company[future] = (set_name, company_id)
+                wake_up_time = min(next_reload_check, next_outbox_check)
+                if poll_schedule:
+                    wake_up_time = min(wake_up_time, poll_schedule[0][0])
+                wait_seconds = max(wake_up_time - time.monotonic(), 0)
+                if future_to_company:
+                    done_futures, _ = wait(future_to_company, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+                    for future in done_futures:
+                        finish_poll(future)
+                else:
+                    stop_event.wait(wait_seconds)
+            for future in as_completed(list(future_to_company)):
+                finish_poll(future)
+    finally:
+        for known_jobs_store in known_jobs_stores.values():
+            known_jobs_store.close()
+    logging.info('Daemon stopped.')
+
+
+def main():
+    daemon_mode = sys.argv[1:2] == ['--daemon']
+    set_names = get_set_names(sys.argv[2:] if daemon_mode else sys.argv[1:])
+    if not set_names:
+        print("Error, set name needed. Please provide set[1-13] or all. Eg: set-1 set-3, "
+              "or --daemon set-1 set-3 to keep polling them")
+        return
+    # the records go to the file of the set being checked, the null handler
+    # keeps logging from falling back to stderr in between the sets
+    logging.basicConfig(level=logging.DEBUG, handlers=[logging.NullHandler()])
     load_dotenv()
-    start_time = datetime.now()
+    if daemon_mode:
+        start_daemon_log()
+    # The sets share one session, http engine and notifier, but every set
+    # keeps its own log file and known jobs database
     with requests.session() as session:
-        current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-        company_info = None
+        start_notifier(session)
         try:
-            send_deployment_notification_to_user(
-                "Info", f'{current_date_time} - Starting the application ...', session)
-            # -- Already Known Stuff --
-            company_info = get_company_data(os.path.join(DATA_FOLDER_LOCATION, set_name))
-            # -- Fetching New Data --
-            for company_id in company_info:
-                company_name = company_info[company_id]['CompanyName']
-                monitor_status = company_info[company_id]['MonitorStatus']
-                if monitor_status != 'Enabled':
-                    logging.info(
-                        f"Bypassing {company_name} as information not available")
-                    continue
-                # Get the keywords for this company
-                keywords = company_info[company_id]['Keywords']
-                company_portal = company_info[company_id]['CompanyPortal']
-                # Get the search API url
-                search_api_url = company_info[company_id]['SearchAPI']
-                search_api_type = company_info[company_id]['SearchType']
-                search_api_header = company_info[company_id]['SearchHeader']
-                search_api_extra_header = company_info[company_id]['SearchExtraHeader']
-                known_jobs = company_info[company_id]['KnownJobs'].split('|')
-                relevant_jobs = get_relevant_jobs(company_name, company_portal, search_api_type,
-                                                  search_api_url, keywords, search_api_header, search_api_extra_header, session)
-                if len(relevant_jobs) < 1:
-                    continue
-                for job_id in relevant_jobs:
-                    # If job not present in the already notified list,
-                    # notify it to the user, add that job id to already notified list
-                    if job_id not in known_jobs:
-                        job_title = relevant_jobs[job_id]['title']
-                        job_posted_date = relevant_jobs[job_id]['posted_date']
-                        job_application_link = relevant_jobs[job_id]['apply']
-                        logging.info(
-                            f'New job found: {job_title} posted on : {job_posted_date} for company:{company_name}. Notifying user ...')
-                        # send notification
-                        send_notification_to_user(company_name, job_id, job_title,
-                                                  job_posted_date, job_application_link, session)
-                        # save the job id to known jobs list
-                        known_jobs.append(job_id)
-                company_info[company_id]['KnownJobs'] = '|'.join(known_jobs)
-            # rewrite the csv file with the new known job list
-            if company_info:
-                update_known_jobs(company_info, os.path.join(DATA_FOLDER_LOCATION, set_name))
-            logging.info('All new jobs notified to the user.')
             current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
             send_deployment_notification_to_user(
-                "Information", f"{current_date_time} - Application completed successfully.", session)
-        except Exception as e:
-            if company_info:
-                update_known_jobs(company_info, os.path.join(DATA_FOLDER_LOCATION, set_name))
-            current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
-            logging.error(f'Error occurred: {e}')
-            # send error notification to user
-            send_error_notification_to_user(
-                f"{set_name} - {current_date_time} - {traceback.format_exc()}", session)
-    current_date_time = datetime.now()
-    total_time = (current_date_time - start_time)
-    logging.info(f"Total Time Taken: {total_time}")            
-    logging.info(f'Last execution: {current_date_time.strftime("%d/%m/%Y %H:%M:%S")}')            
+                "Info", f'{current_date_time} - Starting the application for {", ".join(set_names)} ...')
+            if daemon_mode:
+                try:
+                    run_daemon(set_names, session)
+                except Exception as e:
+                    logging.error(f'Error occurred: {e}')
+                    current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                    send_error_notification_to_user(
+                        f"Daemon - {current_date_time} - {traceback.format_exc()}")
+                else:
+                    current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                    send_deployment_notification_to_user(
+                        "Information", f"{current_date_time} - Daemon stopped.")
+            else:
+                failed_set_names = []
+                for set_name in set_names:
+                    set_log_handler = start_set_log(set_name)
+                    start_time = datetime.now()
+                    try:
+                        check_set(set_name, session)
+                    except Exception as e:
+                        current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                        logging.error(f'Error occurred: {e}')
+                        # send error notification to user, the next sets still run
+                        send_error_notification_to_user(
+                            f"{set_name} - {current_date_time} - {traceback.format_exc()}")
+                        failed_set_names.append(set_name)
+                    finally:
+                        current_date_time = datetime.now()
+                        total_time = (current_date_time - start_time)
+                        logging.info(f"Total Time Taken: {total_time}")
+                        logging.info(f'Last execution: {current_date_time.strftime("%d/%m/%Y %H:%M:%S")}')
+                        stop_set_log(set_log_handler)
+                if not failed_set_names:
+                    current_date_time = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                    send_deployment_notification_to_user(
+                        "Information", f"{current_date_time} - Application completed successfully.")
+        finally:
+            # wait for the queued notifications to be sent
+            close_notifier()
+    close_engine()
+    close_http_cache()
+    close_job_details_cache()
 
 
 if __name__ == '__main__':
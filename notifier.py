@@ -0,0 +1,304 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List
+
+from constants import DATA_FOLDER_LOCATION, SLACK_OUTBOX_DB, \
+    SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK_VAR, SLACK_ERROR_NOTIFICATION_WEBHOOK_VAR, \
+    SLACK_JOB_NOTIFICATION_WEBHOOK_VAR, SLACK_JOBS_PER_MESSAGE, SLACK_MESSAGES_PER_SECOND, \
+    SLACK_MESSAGE_BURST, SLACK_MAX_RETRIES, SLACK_RETRY_BACKOFF_SECONDS, SLACK_OUTBOX_RESEND_AFTER_SECONDS
+
+# Every Slack message goes through one background sender. A message is first
+# written to the outbox database, then posted at no more than
+# SLACK_MESSAGES_PER_SECOND, and only removed from the outbox once Slack
+# accepted it. Messages left over by a killed or failed run are sent again by
+# the next run, once they are old enough not to be in flight in a run of
+# another set.
+notification_queue = queue.Queue()
+# ids of the messages queued or being posted, so the outbox isn't queued twice
+queued_message_ids = set()
+queued_message_ids_lock = threading.Lock()
+notifier_thread = None
+notifier_lock = threading.Lock()
+outbox_connection = None
+outbox_lock = threading.Lock()
+bucket_tokens = float(SLACK_MESSAGE_BURST)
+bucket_updated = time.monotonic()
+
+
+def open_outbox() -> sqlite3.Connection:
+    """opens the outbox database of the undelivered slack messages, creating it on first use
+
+    Returns:
+        sqlite3.Connection: connection to the outbox database
+    """
+    global outbox_connection
+    with outbox_lock:
+        if outbox_connection is None:
+            outbox_connection = sqlite3.connect(os.path.join(DATA_FOLDER_LOCATION, SLACK_OUTBOX_DB),
+                                                check_same_thread=False)
+            outbox_connection.execute('PRAGMA journal_mode = WAL')
+            outbox_connection.execute('''CREATE TABLE IF NOT EXISTS outbox (
+                                             message_id INTEGER PRIMARY KEY,
+                                             webhook_var TEXT NOT NULL,
+                                             payload TEXT NOT NULL,
+                                             created TEXT NOT NULL)''')
+            outbox_connection.commit()
+        return outbox_connection
+
+
+def queue_message(webhook_var: str, payload: Dict):
+    """saves the slack message in the outbox and queues it for the sender
+
+    Args:
+        webhook_var (str): environment variable holding the webhook url
+        payload (Dict): slack webhook payload
+    """
+    connection = open_outbox()
+    with outbox_lock:
+        message_id = connection.execute(
+            'INSERT INTO outbox (webhook_var, payload, created) VALUES (?, ?, ?)',
+            (webhook_var, json.dumps(payload), datetime.now().isoformat(timespec='seconds'))).lastrowid
+        connection.commit()
+    with queued_message_ids_lock:
+        queued_message_ids.add(message_id)
+    notification_queue.put((message_id, webhook_var, payload))
+
+
+def remove_message(message_id: int):
+    """removes a delivered or rejected message from the outbox
+
+    Args:
+        message_id (int): outbox message id
+    """
+    with outbox_lock:
+        outbox_connection.execute(
+            'DELETE FROM outbox WHERE message_id = ?', (message_id,))
+        outbox_connection.commit()
+
+
+def wait_for_rate_limit():
+    """blocks until the token bucket allows the next slack message"""
+    global bucket_tokens, bucket_updated
+    while True:
+        now = time.monotonic()
+        bucket_tokens = min(float(SLACK_MESSAGE_BURST),
+                            bucket_tokens + (now - bucket_updated) * SLACK_MESSAGES_PER_SECOND)
+        bucket_updated = now
+        if bucket_tokens >= 1:
+            bucket_tokens -= 1
+            return
+        time.sleep((1 - bucket_tokens) / SLACK_MESSAGES_PER_SECOND)
+
+
+def get_retry_after(retry_after: str, default_seconds: float) -> float:
+    """gets the seconds to wait from a Retry-After header, given in seconds or as an http date
+
+    Args:
+        retry_after (str): Retry-After header, None when slack didn't send one
+        default_seconds (float): seconds to wait when the header is missing or can't be read
+
+    Returns:
+        float: seconds to wait before posting again
+    """
+    if not retry_after:
+        return default_seconds
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        logging.warning(f'Unreadable Retry-After header from slack: {retry_after}')
+        return default_seconds
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def post_message(session, webhook_var: str, payload: Dict):
+    """posts a message to the slack webhook, retrying rate limited and failed posts
+
+    Args:
+        session (request): session for the url
+        webhook_var (str): environment variable holding the webhook url
+        payload (Dict): slack webhook payload
+
+    Returns:
+        bool: True when slack accepted the message or rejected it for good,
+            False when it should stay in the outbox for a later run
+    """
+    webhook_url = os.getenv(webhook_var)
+    if not webhook_url:
+        logging.error(f'{webhook_var} is not set, keeping the message in the outbox.')
+        return False
+    for attempt in range(SLACK_MAX_RETRIES + 1):
+        wait_for_rate_limit()
+        try:
+            req = session.post(url=webhook_url,
+                               headers={
+                                   'Content-type': 'application/json'},
+                               json=payload)
+        except Exception as e:
+            logging.warning(f'Slack notification failed: {e}')
+            retry_after = SLACK_RETRY_BACKOFF_SECONDS * 2 ** attempt
+        else:
+            logging.info(
+                'Notification sent with response status code: '
+                + str(req.status_code))
+            if req.status_code < 300:
+                return True
+            if req.status_code == 429:
+                retry_after = get_retry_after(req.headers.get('Retry-After'),
+                                              SLACK_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+            elif req.status_code >= 500:
+                retry_after = SLACK_RETRY_BACKOFF_SECONDS * 2 ** attempt
+            else:
+                # the message itself is bad, sending it again won't help
+                logging.error(
+                    f'Slack rejected the notification: {req.status_code} - {req.text}')
+                return True
+        if attempt < SLACK_MAX_RETRIES:
+            time.sleep(retry_after)
+    logging.error('Slack notification not delivered, keeping it in the outbox.')
+    return False
+
+
+def send_queued_messages(session):
+    """posts the queued messages until the notifier is closed
+
+    Args:
+        session (request): session for the url
+    """
+    while True:
+        message = notification_queue.get()
+        if message is None:
+            return
+        message_id, webhook_var, payload = message
+        try:
+            if post_message(session, webhook_var, payload):
+                remove_message(message_id)
+        except Exception as e:
+            # the message stays in the outbox, the sender must keep going for the others
+            logging.error(f'Failed to send the notification {message_id}: {e}')
+        with queued_message_ids_lock:
+            queued_message_ids.discard(message_id)
+
+
+def queue_outbox_messages() -> int:
+    """queues the messages of the outbox which aren't queued yet
+
+    Only messages older than SLACK_OUTBOX_RESEND_AFTER_SECONDS are picked up, the
+    newer ones may still be on their way out from a run of another set.
+
+    Returns:
+        int: number of messages queued
+    """
+    connection = open_outbox()
+    resend_before = datetime.now() - timedelta(seconds=SLACK_OUTBOX_RESEND_AFTER_SECONDS)
+    with outbox_lock:
+        pending_messages = connection.execute(
+            'SELECT message_id, webhook_var, payload FROM outbox WHERE created < ? ORDER BY message_id',
+            (resend_before.isoformat(timespec='seconds'),)).fetchall()
+    with queued_message_ids_lock:
+        pending_messages = [message for message in pending_messages if message[0] not in queued_message_ids]
+        queued_message_ids.update(message[0] for message in pending_messages)
+    if pending_messages:
+        logging.info(
+            f'Resending {len(pending_messages)} undelivered notifications from the outbox.')
+    for message_id, webhook_var, payload in pending_messages:
+        notification_queue.put((message_id, webhook_var, json.loads(payload)))
+    return len(pending_messages)
+
+
+def start_notifier(session):
+    """starts the background sender, queueing the messages left in the outbox by earlier runs
+
+    Args:
+        session (request): session for the url
+    """
+    global notifier_thread
+    with notifier_lock:
+        if notifier_thread is not None:
+            return
+        queue_outbox_messages()
+        notifier_thread = threading.Thread(
+            target=send_queued_messages, args=(session,), name='notifier', daemon=True)
+        notifier_thread.start()
+
+
+def close_notifier():
+    """waits for the queued messages to be sent and stops the sender"""
+    global notifier_thread, outbox_connection
+    with notifier_lock:
+        if notifier_thread is None:
+            return
+        notification_queue.put(None)
+        notifier_thread.join()
+        notifier_thread = None
+        with outbox_lock:
+            outbox_connection.close()
+            outbox_connection = None
+
+
+def send_deployment_notification_to_user(notification_type: str, notification_message: str):
+    """sends the deployment notification to user
+
+    Args:
+        notification_type (str): notification type
+        notification_message (str): notification message
+    """
+    queue_message(SLACK_DEPLOYMENT_NOTIFICATION_WEBHOOK_VAR,
+                  {'text': f'Deployment Message: {notification_type} - {notification_message}'})
+
+
+def send_error_notification_to_user(notification_message: str):
+    """sends the error notification to user
+
+    Args:
+        notification_message (str): notification message
+    """
+    queue_message(SLACK_ERROR_NOTIFICATION_WEBHOOK_VAR,
+                  {'text': f'Error Message: ERROR - {notification_message}'})
+
+
+def get_job_notification_message(company_name: str, jobs: List[Dict]) -> Dict:
+    """builds the slack message for a batch of new jobs of a company
+
+    Args:
+        company_name (str): company name
+        jobs (List[Dict]): new jobs with their job_id, title, posted_date and apply link
+
+    Returns:
+        Dict: slack webhook payload, with a plain text fallback for the blocks
+    """
+    job_texts = [f'Job Id: *{job["job_id"]}*\nJob Title: *{job["title"]}*\n'
+                 f'Posted Date: *{job["posted_date"].strftime("%m/%d/%Y")}*\nApply: <{job["apply"]}>'
+                 for job in jobs]
+    blocks = [{'type': 'section',
+               'text': {'type': 'mrkdwn', 'text': f'*{len(jobs)} new job(s) at {company_name}*'}}]
+    for job_text in job_texts:
+        blocks.append({'type': 'divider'})
+        blocks.append({'type': 'section',
+                       'text': {'type': 'mrkdwn', 'text': job_text}})
+    return {'text': f'Company Name: *{company_name}*\n' + '\n----------\n'.join(job_texts),
+            'blocks': blocks}
+
+
+def notify_new_jobs(company_name: str, jobs: List[Dict]):
+    """queues the new jobs of a company, one slack message per SLACK_JOBS_PER_MESSAGE jobs
+
+    Args:
+        company_name (str): company name
+        jobs (List[Dict]): new jobs with their job_id, title, posted_date and apply link
+    """
+    for batch_start in range(0, len(jobs), SLACK_JOBS_PER_MESSAGE):
+        queue_message(SLACK_JOB_NOTIFICATION_WEBHOOK_VAR, get_job_notification_message(
+            company_name, jobs[batch_start:batch_start + SLACK_JOBS_PER_MESSAGE]))
@@ -0,0 +1,76 @@
+import math
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from constants import PARALLEL_PAGINATION, PAGINATION_PREFETCH_PAGES, PAGINATION_DATE_SORTED_PREFETCH_PAGES, \
+    DAYS_TO_CHECK
+from http_engine import fetch_search_url, run_in_engine, get_responses_for_search_urls
+
+
+def get_paginated_jobs(first_page_response, page_size: int, max_pages: int,
+                       get_total: Callable[[Any], int], build_page_request: Callable[[int, Any], tuple],
+                       parse_page: Callable[[Any], Dict], load_page: Callable[[Any], Any] = None,
+                       get_posted_dates: Callable[[Any], List[date]] = None) -> Dict:
+    """gets the relevant jobs from every page of a paginated search
+
+    The portal declares its page size, where the total lives and how to build
+    the request of a page. Pages after the first are prefetched in windows of
+    PAGINATION_PREFETCH_PAGES concurrent requests. The walk stops at the first
+    empty response or after max_pages pages. For portals sorted newest first it
+    also stops once every job of a page is older than DAYS_TO_CHECK, since the
+    later pages can only be older.
+
+    Args:
+        first_page_response (Any): response for the first page, already fetched by the caller
+        page_size (int): number of jobs on a page
+        max_pages (int): maximum number of pages to visit, including the first one
+        get_total (Callable[[Any], int]): reads the total job count from the loaded first page
+        build_page_request (Callable[[int, Any], tuple]): builds the (search type, search api url,
+            search api header, search api extra header) request for a zero based page index
+            from the loaded first page
+        parse_page (Callable[[Any], Dict]): gets the relevant jobs from a loaded page
+        load_page (Callable[[Any], Any]): turns a raw response into the page read by
+            get_total and parse_page, the raw response is used when not given
+        get_posted_dates (Callable[[Any], List[date]]): posting dates of the jobs of a loaded
+            page, only given by portals whose results are sorted by posting date
+
+    Returns:
+        Dict[str, Dict]: relevant jobs of all the visited pages, later pages win on duplicate job ids
+    """
+    if load_page is None:
+        def load_page(response):
+            return response
+
+    def is_page_outside_check_window(page):
+        if get_posted_dates is None:
+            return False
+        posted_dates = get_posted_dates(page)
+        today = date.today()
+        return len(posted_dates) > 0 and all(
+            (today - posted_date).days >= DAYS_TO_CHECK for posted_date in posted_dates)
+
+    first_page = load_page(first_page_response)
+    relevant_jobs = parse_page(first_page)
+    total_jobs = get_total(first_page)
+    if not total_jobs or is_page_outside_check_window(first_page):
+        return relevant_jobs
+    no_of_pages = min(math.ceil(total_jobs / page_size), max_pages)
+    page_indexes = list(range(1, no_of_pages))
+    # date sorted portals fetch fewer pages ahead, so an early stop saves requests
+    prefetch_pages = PAGINATION_PREFETCH_PAGES if get_posted_dates is None else PAGINATION_DATE_SORTED_PREFETCH_PAGES
+    for window_start in range(0, len(page_indexes), prefetch_pages):
+        page_requests = [build_page_request(page_index, first_page) for page_index in
+                         page_indexes[window_start:window_start + prefetch_pages]]
+        if PARALLEL_PAGINATION:
+            page_responses = get_responses_for_search_urls(page_requests)
+        else:
+            page_responses = (run_in_engine(fetch_search_url(*page_request))
+                              for page_request in page_requests)
+        for page_response in page_responses:
+            if not page_response:
+                return relevant_jobs
+            page = load_page(page_response)
+            relevant_jobs.update(parse_page(page))
+            if is_page_outside_check_window(page):
+                return relevant_jobs
+    return relevant_jobs
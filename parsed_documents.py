@@ -0,0 +1,51 @@
+import contextvars
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable
+
+# documents parsed for the company being polled, every keyword reads the
+# same board page, so it is only parsed for the first one
+parsed_documents_var = contextvars.ContextVar('parsed_documents', default=None)
+parsed_documents_lock = threading.Lock()
+
+
+@contextmanager
+def reusing_parsed_documents():
+    """makes the pages parsed within the block be parsed only once"""
+    token = parsed_documents_var.set({})
+    try:
+        yield
+    finally:
+        parsed_documents_var.reset(token)
+
+
+def get_parsed_document(html: str, parse_key: Hashable, parse: Callable[[], Any]) -> Any:
+    """gets a page parsed the same way before, parsing it on a miss
+
+    Args:
+        html (str): page html
+        parse_key (Hashable): tells apart the ways a page is parsed
+        parse (Callable[[], Any]): parses the page
+
+    Returns:
+        Any: parsed page, shared by the keywords so it must only be read
+    """
+    parsed_documents = parsed_documents_var.get()
+    if parsed_documents is None or not isinstance(html, str):
+        return parse()
+    document_key = (html, parse_key)
+    with parsed_documents_lock:
+        parsed_document = parsed_documents.get(document_key)
+        is_first_parse = parsed_document is None
+        if is_first_parse:
+            parsed_document = parsed_documents[document_key] = Future()
+    if not is_first_parse:
+        return parsed_document.result()
+    try:
+        parsed_page = parse()
+    except BaseException as e:
+        parsed_document.set_exception(e)
+        raise
+    parsed_document.set_result(parsed_page)
+    return parsed_page
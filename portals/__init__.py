@@ -0,0 +1,55 @@
+import importlib
+from typing import Callable, Dict
+
+# Module of the portals package holding each portal adapter. A module is only
+# imported the first time a company of the running set uses its adapter, so
+# a run loads the parsers (and their html and fuzzy matching dependencies) of
+# the companies it checks and nothing else.
+PORTAL_ADAPTER_MODULES = {
+    'Amazon': 'amazon',
+    'Google': 'google',
+    'Netflix': 'netflix',
+    'Apple': 'apple',
+    'Microsoft': 'microsoft',
+    'Tencent': 'tencent',
+    'Oracle': 'oracle',
+    'DeepMind': 'deepmind',
+    'JaneStreet': 'janestreet',
+    'Intuit': 'intuit',
+    'GoldmanSachs': 'goldman_sachs',
+    'LG': 'lg',
+    'Uber': 'uber',
+    'Tiktok': 'tiktok',
+    'Akamai': 'akamai',
+    'Atlassian': 'atlassian',
+    'AMD': 'amd',
+    'Cisco': 'cisco',
+    'SchniederElectric': 'schnieder_electric',
+    'Stripe': 'stripe',
+    'Tesla': 'tesla',
+    'IBM': 'ibm',
+    'OracleCloud': 'oracle_cloud',
+    'Eightfold': 'eightfold',
+    'Workday': 'workday',
+    'GreenHouse': 'greenhouse',
+    'GreenHouseAPI': 'greenhouse_api',
+    'Lever': 'lever',
+    'LeverAPI': 'lever_api',
+    'SmartRecruiters': 'smartrecruiters',
+}
+
+
+def get_portal_adapter(adapter_name: str) -> Callable[..., Dict[str, Dict]]:
+    """imports the module of a portal adapter on first use and gets its entry point
+
+    Every adapter is called with (keyword, response, search api url, search api
+    header, search api extra header, session, adapter params) and returns the
+    relevant jobs of the response.
+
+    Args:
+        adapter_name (str): adapter name, as used in the portal registry and the CompanyPortal column
+
+    Returns:
+        Callable[..., Dict[str, Dict]]: get_relevant_jobs function of the adapter module
+    """
+    return importlib.import_module(f'{__name__}.{PORTAL_ADAPTER_MODULES[adapter_name]}').get_relevant_jobs
@@ -0,0 +1,70 @@
+import math
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_akamai(keyword, response, search_api_url, search_api_header, search_api_extra_header, session) -> Dict[str, Dict]:
+    """gets the job information from microsoft's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        search_api_url (str): search api url for apple's career page
+        response (Dict): initial response from the search api url
+        session (request): request session object 
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_json_response(page_response, keyword):
+        page_relevant_jobs = {}
+        if "pagingData" not in page_response:
+            return page_relevant_jobs
+        if "totalCount" not in page_response["pagingData"]:
+            return page_relevant_jobs
+        total_jobs = page_response["pagingData"]["totalCount"]
+        page_available_jobs = page_response["requisitionList"]
+        if (total_jobs == 0) or (len(page_available_jobs) == 0):
+            return page_relevant_jobs, 0
+        no_of_pages = math.ceil(total_jobs / len(page_available_jobs))
+        match_titles([job['column'][0] for job in page_available_jobs if 'jobId' in job])
+        for job in page_available_jobs:
+            if 'jobId' in job:
+                job_id = job['jobId']
+                curr_job_title = job['column'][0]
+                posted_date = parse_posted_date(job['column'][2], "%b %d, %Y")
+                today = date.today()
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://akamaicareers.inflightcloud.com/apply?section=aka_ext&job={job_id}"}
+        return page_relevant_jobs, no_of_pages
+
+    relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+        response, keyword)
+    if no_of_pages > 1:
+        curr_page_count = 2
+        while (curr_page_count < min(5, no_of_pages)):
+            search_api_header['pageNo'] = curr_page_count
+            new_response = get_response_for_search_url("POST",
+                                                       search_api_url, session, search_api_header, search_api_extra_header)
+            if not new_response:
+                return relevant_jobs
+            new_relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+                new_response, keyword)
+            relevant_jobs.update(new_relevant_jobs)
+            curr_page_count += 1
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_akamai(keyword, response, search_api_url, search_api_header,
+                      search_api_extra_header, session)
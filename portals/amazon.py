@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_amazon(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """logic for getting jobs from amazon careers page response
+
+    Args:
+        keyword (str): keyword for job title matching
+        response (Dict): raw response from the website
+
+    Returns:
+        Dict[str, Dict]: relevant jobs where key is jobID and value is jobInformation
+    """
+    relevant_jobs = {}
+    available_jobs = response['jobs']
+    match_titles([job['title'] for job in available_jobs])
+    for job in available_jobs:
+        job_id = job['id_icims']
+        curr_job_title = job['title']
+        posted_date = parse_posted_date(job['posted_date'], "%B %d, %Y")
+        today = date.today()
+        if title_matches_keyword(curr_job_title, keyword):
+            if not is_title_ignored(curr_job_title):
+                date_difference = today - posted_date
+                if date_difference.days < DAYS_TO_CHECK:
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://www.amazon.jobs{job['job_path']}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_amazon(keyword, response)
@@ -0,0 +1,79 @@
+import json
+from datetime import date
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_apple(keyword: str, response: Dict, search_api_url: str, session) -> Dict[str, Dict]:
+    """gets the job positions from apple's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): page response
+        search_api_url (str): search api url for apple's career page
+        session (request): request session object
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_page(page_available_jobs, keyword):
+        page_relevant_jobs = {}
+        match_titles([job['postingTitle'] for job in page_available_jobs])
+        for job in page_available_jobs:
+            job_id = job['positionId']
+            curr_job_title = job['postingTitle']
+            posted_date = parse_posted_date(job['postingDate'], "%b %d, %Y")
+            today = date.today()
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        page_relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date,
+                            'apply': f"https://jobs.apple.com/en-us/details/{job_id}/{job['transformedPostingTitle']}?team={job['team']['teamCode']}"}
+        return page_relevant_jobs
+
+    def get_app_state_from_html_response(page_response):
+        soup = BeautifulSoup(page_response, 'html.parser')
+        scripts = soup.find_all('script', {"type": "text/javascript"})
+        if len(scripts) == 0:
+            return None
+        data = scripts[0].text
+        data = data.replace("\n      window.APP_STATE = ", "")
+        data = data.replace(";\n", "").strip()
+        return json.loads(data)
+
+    def get_total_from_app_state(app_state):
+        if not app_state or not app_state['fullUrl']:
+            return 0
+        return app_state['totalRecords']
+
+    def get_relevant_jobs_from_app_state(app_state):
+        if not app_state or not app_state['totalRecords']:
+            return {}
+        return get_relevant_jobs_from_page(app_state['searchResults'], keyword)
+
+    def get_posted_dates_from_app_state(app_state):
+        if not app_state or not app_state['totalRecords']:
+            return []
+        return [parse_posted_date(job['postingDate'], "%b %d, %Y") for job in app_state['searchResults']]
+
+    return get_paginated_jobs(response, page_size=20, max_pages=4,
+                              get_total=get_total_from_app_state,
+                              build_page_request=lambda page_index, first_page: (
+                                  "GET", first_page['fullUrl'] + f'&page={page_index + 1}', "", ""),
+                              parse_page=get_relevant_jobs_from_app_state,
+                              load_page=get_app_state_from_html_response,
+                              get_posted_dates=get_posted_dates_from_app_state if 'sort=newest' in search_api_url else None)
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_apple(keyword, response, search_api_url, session)
@@ -0,0 +1,44 @@
+from datetime import datetime, date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_atlassian(keyword, response) -> Dict[str, Dict]:
+    """gets the job information from atlassian's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    if 'postings' not in response:
+        return relevant_jobs
+    available_jobs = response['postings']
+    match_titles([job['text'] for job in available_jobs if 'id' in job])
+    for job in available_jobs:
+        if 'id' in job:
+            job_id = job['id']
+            location = job['categories']['location']
+            if "United States" not in location:
+                continue
+            curr_job_title = job['text']
+            posted_date = datetime.fromtimestamp(job['updatedAt']/1000).date()
+            today = date.today()
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://jobs.lever.co/atlassian/{job_id}/apply"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_atlassian(keyword, response)
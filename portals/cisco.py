@@ -0,0 +1,89 @@
+import json
+import urllib.parse
+from datetime import date
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from constants import DAYS_TO_CHECK
+from http_engine import fetch_text, run_in_engine
+from job_details_cache import get_job_details
+from job_dates import parse_posted_date
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def get_cisco_job_details(job_link):
+    def fetch_job_details():
+        new_response_date = run_in_engine(fetch_text(job_link))
+        date_soup = BeautifulSoup(
+            new_response_date.strip(), 'html.parser')
+        date_scripts = date_soup.find_all(
+            'script', {'type': 'application/ld+json'})
+        if len(date_scripts) == 0:
+            return None
+        if len(date_scripts[0].contents) == 0:
+            return None
+        date_inter = date_scripts[0].contents[0]
+        date_json = json.loads(date_inter)
+        return {'posted_date': date_json['datePosted']}
+
+    return get_job_details(job_link, fetch_job_details)
+
+
+def for_cisco(keyword, response, search_api_url, session) -> Dict[str, Dict]:
+    """gets the job information from cisco's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_html_response(page_response, keyword):
+        response_relevant_jobs = {}
+        soup = BeautifulSoup(page_response.strip(), 'html.parser')
+        scripts = soup.find_all('tbody')
+        if len(scripts) > 0:
+            data = scripts[0]
+            for item in data.contents:
+                if item.text == '\n':
+                    continue
+                temp = item.contents[1]
+                if temp.text == 'No results':
+                    break
+                job_link = temp.contents[0]['href']
+                job_id = job_link.split('/')[-1]
+                curr_job_title = item.contents[1].contents[0].text
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        today = date.today()
+                        job_details = get_cisco_job_details(job_link)
+                        if job_details is None:
+                            return response_relevant_jobs
+                        posted_date = parse_posted_date(job_details['posted_date'], "%Y-%m-%d")
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            response_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date,
+                                'apply': job_link}
+        return response_relevant_jobs
+
+    total_url = f"https://jobs.cisco.com/jobs/SearchJobsResultsAJAX/{urllib.parse.quote(keyword)}?21178=%5B169482%5D&21178_format=6020&21180=%5B164,163%5D&21180_format=6022&listFilterMode=1"
+    response_total = run_in_engine(fetch_text(total_url))
+    total_jobs = int(response_total.strip().replace('+',''))
+    if total_jobs == 0:
+        return {}
+    return get_paginated_jobs(response, page_size=25, max_pages=20,
+                              get_total=lambda page_response: total_jobs,
+                              build_page_request=lambda page_index, first_page: (
+                                  "GET", search_api_url + f'&projectOffset={25*page_index}', "", ""),
+                              parse_page=lambda page_response: get_relevant_jobs_from_html_response(
+                                  page_response, keyword))
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_cisco(keyword, response, search_api_url, session)
@@ -0,0 +1,42 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_deepmind(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """logic for getting jobs from amazon careers page response
+
+    Args:
+        keyword (str): keyword for job title matching
+        response (Dict): raw response from the website
+
+    Returns:
+        Dict[str, Dict]: relevant jobs where key is jobID and value is jobInformation
+    """
+    relevant_jobs = {}
+    available_jobs = response['jobs']
+    match_titles([job['title'] for job in available_jobs if 'title' in job])
+    for job in available_jobs:
+        job_id = str(job['id'])
+        if 'title' in job:
+            curr_job_title = job['title']
+            posted_date = parse_posted_date(job['updated_at'], "%Y-%m-%dT%H:%M:%S%z")
+            today = date.today()
+            location = job['location']['name']
+            if "US" in location:
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': job['absolute_url']}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_deepmind(keyword, response)
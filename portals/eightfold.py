@@ -0,0 +1,49 @@
+from datetime import datetime, date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_eightfold_based_company(company_page_respone, company_job_keyword, search_api_url, session):
+    def get_relevant_jobs_from_json_response(page_response):
+        page_relevant_jobs = {}
+        if "count" not in page_response:
+            return page_relevant_jobs
+        page_available_jobs = page_response["positions"]
+        match_titles([job['name'] for job in page_available_jobs if 'name' in job])
+        for job in page_available_jobs:
+            if 'name' in job:
+                job_id = str(job['id'])
+                curr_job_title = job['name']
+                # convert from timestamp to date
+                posted_date = datetime.fromtimestamp(job['t_update']).date()
+                today = date.today()
+                if title_matches_keyword(curr_job_title, company_job_keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': job['canonicalPositionUrl']}
+        return page_relevant_jobs
+
+    def get_posted_dates_from_json_response(page_response):
+        return [datetime.fromtimestamp(job['t_update']).date()
+                for job in page_response.get("positions", []) if 't_update' in job]
+
+    if "count" not in company_page_respone:
+        return {}
+    is_date_sorted = ('sort_by=timestamp' in search_api_url) or ('sort_by=new' in search_api_url)
+    return get_paginated_jobs(company_page_respone, page_size=10, max_pages=5,
+                              get_total=lambda page_response: page_response.get("count", 0),
+                              build_page_request=lambda page_index, first_page: (
+                                  "GET", search_api_url + f"&start={page_index*10}&num=10", "", ""),
+                              parse_page=get_relevant_jobs_from_json_response,
+                              get_posted_dates=get_posted_dates_from_json_response if is_date_sorted else None)
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_eightfold_based_company(response, keyword, search_api_url, session)
@@ -0,0 +1,46 @@
+import urllib.parse
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_goldman_sachs(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """gets the job information from goldman sachs's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    if "data" not in response:
+        return relevant_jobs
+    if "roleSearch" not in response["data"]:
+        return relevant_jobs
+    if "items" not in response["data"]["roleSearch"]:
+        return relevant_jobs
+    available_jobs = response["data"]["roleSearch"]["items"]
+    match_titles([job['jobTitle'] for job in available_jobs if 'jobTitle' in job])
+    for job in available_jobs:
+        if 'jobTitle' in job:
+            job_id = job['externalSource']['sourceId']
+            curr_job_title = job['jobTitle']
+            posted_date = date.today()
+            today = date.today()
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://higher.gs.com/roles?title={urllib.parse.quote(curr_job_title)}&id={job_id}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_goldman_sachs(keyword, response)
@@ -0,0 +1,63 @@
+import json
+from datetime import date
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_google(keyword: str, response: Dict, search_api_url, session) -> Dict[str, Dict]:
+    """logic for getting jobs from google careers page response
+
+    Args:
+        keyword (str): keyword for job title matching
+        response (Dict): raw response from the website
+
+    Returns:
+        Dict[str, Dict]: relevant jobs where key is jobID and value is jobInformation
+    """
+    def get_relevant_jobs_from_page(page_available_jobs, keyword):
+        page_relevant_jobs = {}
+        match_titles([job[1].split(",")[0] for job in page_available_jobs])
+        for job in page_available_jobs:
+            job_id = job[0]
+            curr_job_title = job[1].split(",")[0]
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    page_relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': date.today(),
+                        'apply': job[2]}
+        return page_relevant_jobs
+
+    def get_search_data_from_html_response(page_response):
+        soup = BeautifulSoup(page_response, 'html.parser')
+        scripts = soup.find_all('script')
+        json_data = None
+        for script in scripts:
+            data = script.text
+            if not data.startswith("AF_initDataCallback({key: \'ds:1\'"):
+                continue
+            data = data.replace("hash: \'2\',", "").replace("hash: \'1\',", "").replace(
+                "AF_initDataCallback({key: \'ds:1\',", "{").replace("data:", '"data":').replace("sideChannel:", '"sideChannel":')[:-2]
+            json_data = json.loads(data)
+        return json_data
+
+    def get_relevant_jobs_from_search_data(search_data):
+        if not search_data:
+            return {}
+        return get_relevant_jobs_from_page(search_data['data'][0], keyword)
+
+    return get_paginated_jobs(response, page_size=20, max_pages=4,
+                              get_total=lambda search_data: search_data['data'][2] if search_data else 0,
+                              build_page_request=lambda page_index, first_page: (
+                                  "GET", search_api_url + f'&page={page_index + 1}', "", ""),
+                              parse_page=get_relevant_jobs_from_search_data,
+                              load_page=get_search_data_from_html_response)
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_google(keyword, response, search_api_url, session)
@@ -0,0 +1,60 @@
+import json
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from html_parsing import parse_html
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def greenhouse_based_company(company_page_respone, company_job_keyword, session):
+    relevant_jobs = {}
+    soup = parse_html(company_page_respone, "section", {"class": "level-0"})
+    available_jobs = soup.find_all("section", {"class": "level-0"})
+    if len(available_jobs) > 0:
+        for department_jobs in available_jobs:
+            for job in department_jobs.contents:
+                # check if department_jobs is div or not
+                if job.name not in ['div', 'section']:
+                    continue
+                elif job.name == 'div':
+                    job_title = job.text.strip()
+                    job_semi_url = job.contents[1]["href"]
+                elif job.name == 'section':
+                    for sub_job in job.contents:
+                        if sub_job.name == 'div':
+                            job_title = sub_job.text.strip()
+                            job_semi_url = sub_job.contents[1]["href"]
+                            break
+                job_id = job_semi_url.split("/")[-1]
+                job_url = f'https://boards.greenhouse.io{job_semi_url}'
+                if title_matches_keyword(job_title, company_job_keyword):
+                    if not is_title_ignored(job_title):
+                        job_data_response = get_response_for_search_url(
+                            "GET", job_url, session)
+                        job_data_soup = parse_html(
+                            job_data_response, "script", {"type": "application/ld+json"})
+                        job_data = job_data_soup.find_all(
+                            "script", {"type": "application/ld+json"})
+                        if len(job_data) > 0:
+                            job_data = json.loads(job_data[0].text.strip())
+                            job_location = job_data['jobLocation']['address']['addressLocality']
+                            if job_location:
+                                if ('United States' not in job_location) and ('US' not in job_location):
+                                    continue
+                            today = date.today()
+                            posted_date = parse_posted_date(job_data['datePosted'], "%Y-%m-%d")
+                            date_difference = today - posted_date
+                            if date_difference.days < DAYS_TO_CHECK:
+                                relevant_jobs[job_id] = {
+                                    'title': job_title, 'posted_date': posted_date,
+                                    'apply': job_url}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return greenhouse_based_company(response, keyword, session)
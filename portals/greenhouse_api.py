@@ -0,0 +1,52 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def greenhouse_api_based_company(board_response, company_job_keyword) -> Dict[str, Dict]:
+    """gets the relevant jobs from a greenhouse job board api response
+
+    The board api (https://boards-api.greenhouse.io/v1/boards/<board>/jobs)
+    lists the title, location and dates of every job of the board, so no job
+    page has to be fetched. The location rule is the one of the html board.
+
+    Args:
+        board_response (Dict): response of the board api
+        company_job_keyword (str): keyword to match with job title
+
+    Returns:
+        Dict[str, Dict]: relevant jobs where key is jobID and value is jobInformation
+    """
+    relevant_jobs = {}
+    if "jobs" not in board_response:
+        return relevant_jobs
+    available_jobs = board_response["jobs"]
+    match_titles([job['title'] for job in available_jobs if 'title' in job])
+    for job in available_jobs:
+        if 'title' in job:
+            job_id = str(job['id'])
+            job_title = job['title']
+            if title_matches_keyword(job_title, company_job_keyword):
+                if not is_title_ignored(job_title):
+                    job_location = (job.get('location') or {}).get('name')
+                    if job_location:
+                        if ('United States' not in job_location) and ('US' not in job_location):
+                            continue
+                    today = date.today()
+                    posted_date = parse_posted_date(job.get('first_published') or job['updated_at'],
+                                                    "%Y-%m-%dT%H:%M:%S%z")
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': job_title, 'posted_date': posted_date,
+                            'apply': job['absolute_url']}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return greenhouse_api_based_company(response, keyword)
@@ -0,0 +1,41 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_ibm(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """gets all the revelant jobs from ibm's careers page
+
+    Args:
+        keyword (str): keyword to match in job title
+        response (Dict): raw response from ibm's page
+
+    Returns:
+        Dict[str, Dict]: relevant positions with their information
+    """
+    relevant_jobs = {}
+    available_jobs = response['queryResult']
+    match_titles([job['title'] for job in available_jobs])
+    for job in available_jobs:
+        job_id = job['id']
+        curr_job_title = job['title']
+        posted_date = parse_posted_date(job['open_date'], "%Y-%m-%dT%H:%M:%S%z")
+        today = date.today()
+        country = job['primary_country']
+        if country == 'US':
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date, 'apply': f"{job['url']}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_ibm(keyword, response)
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def for_intuit(keyword: str, response: Dict, session) -> Dict[str, Dict]:
+    """gets the job positions from intuit's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): page response
+        session (request): request session object
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    soup = BeautifulSoup(response.strip(), 'html.parser')
+    scripts = soup.find_all("div", {"id": "search-results-list"})
+    if len(scripts) > 0:
+        data = scripts[0]
+        # get second item from contents list
+        ul_data = data.contents[1]
+        for item in ul_data.contents:
+            if item.text == '\n':
+                continue
+            job_data = item.contents[1]
+            job_id = job_data['data-job-id']
+            curr_job_title = job_data['data-title']
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': date.today(),
+                        'apply': f"https://jobs.intuit.com{job_data['href']}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_intuit(keyword, response, session)
@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Dict
+
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_janestreet(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """gets all the revelant jobs from janestreet's careers page
+
+    Args:
+        keyword (str): keyword to match in job title
+        response (Dict): raw response from janestreet's page
+
+    Returns:
+        Dict[str, Dict]: relevant positions with their information
+    """
+    relevant_jobs = {}
+    match_titles([job['position'] for job in response])
+    for job in response:
+        job_id = str(job['id'])
+        curr_job_title = job['position']
+        city = job['city']
+        today = date.today()
+        if title_matches_keyword(curr_job_title, keyword):
+            if not is_title_ignored(curr_job_title):
+                if city == "NYC":
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': today, 'apply': f"https://www.janestreet.com/join-jane-street/position/{job_id}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_janestreet(keyword, response)
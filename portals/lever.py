@@ -0,0 +1,52 @@
+import json
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from html_parsing import parse_html
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def lever_based_company(company_page_respone, company_job_keyword, session, locations):
+    relevant_jobs = {}
+    soup = parse_html(company_page_respone, "div", {"class": "posting"})
+    available_jobs = soup.find_all("div", {"class": "posting"})
+    if len(available_jobs) > 0:
+        for job in available_jobs:
+            # check if department_jobs is div or not
+            job_url = job.contents[1]["href"]
+            job_id = job_url.split("/")[-1]
+            job_title = job.contents[1].text.split('-')[0].strip()
+            if title_matches_keyword(job_title, company_job_keyword):
+                if not is_title_ignored(job_title):
+                    job_data_response = get_response_for_search_url(
+                        "GET", job_url, session)
+                    job_data_soup = parse_html(
+                        job_data_response, "script", {"type": "application/ld+json"})
+                    job_data = job_data_soup.find_all(
+                        "script", {"type": "application/ld+json"})
+                    if len(job_data) > 0:
+                        job_data = json.loads(job_data[0].text.strip())
+                        job_location = job_data['jobLocation']['address']['addressLocality']
+                        if job_location:
+                            if job_location not in locations:
+                                continue
+                        today = date.today()
+                        posted_date = parse_posted_date(job_data['datePosted'], "%Y-%m-%d")
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            relevant_jobs[job_id] = {
+                                'title': job_title, 'posted_date': posted_date,
+                                'apply': job_url}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter
+
+    params: locations, the job locations to keep.
+    """
+    return lever_based_company(response, keyword, session, params['locations'])
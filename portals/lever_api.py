@@ -0,0 +1,71 @@
+from datetime import date, datetime
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def get_job_title(job: Dict) -> str:
+    """gets the title of a posting without the team after its dash, like the html board
+
+    Args:
+        job (Dict): posting of the postings api
+
+    Returns:
+        str: job title
+    """
+    return job['text'].split('-')[0].strip()
+
+
+def lever_api_based_company(postings_response, company_job_keyword, locations) -> Dict[str, Dict]:
+    """gets the relevant jobs from a lever postings api response
+
+    The postings api (https://api.lever.co/v0/postings/<company>?mode=json)
+    lists the title, location and creation time of every posting, so no job
+    page has to be fetched. Like on the html board, the title is cut at its
+    first dash. The location is the posting's category, not the locality of
+    its job page, so it is compared without case, whole or by the part before
+    its first comma ("San Francisco, CA" is kept for "San Francisco").
+
+    Args:
+        postings_response (List[Dict]): response of the postings api
+        company_job_keyword (str): keyword to match with job title
+        locations (List[str]): job locations to keep
+
+    Returns:
+        Dict[str, Dict]: relevant jobs where key is jobID and value is jobInformation
+    """
+    relevant_jobs = {}
+    if not isinstance(postings_response, list):
+        return relevant_jobs
+    match_titles([get_job_title(job) for job in postings_response if 'text' in job])
+    kept_locations = {location.casefold() for location in locations}
+    for job in postings_response:
+        if 'text' in job:
+            job_id = job['id']
+            job_title = get_job_title(job)
+            if title_matches_keyword(job_title, company_job_keyword):
+                if not is_title_ignored(job_title):
+                    job_location = job.get('categories', {}).get('location')
+                    if job_location:
+                        job_location = job_location.casefold()
+                        if job_location not in kept_locations \
+                                and job_location.split(',')[0].strip() not in kept_locations:
+                            continue
+                    today = date.today()
+                    posted_date = datetime.fromtimestamp(job['createdAt'] / 1000).date()
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': job_title, 'posted_date': posted_date,
+                            'apply': job['hostedUrl']}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter
+
+    params: locations, the job locations to keep.
+    """
+    return lever_api_based_company(response, keyword, params['locations'])
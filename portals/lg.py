@@ -0,0 +1,81 @@
+import json
+import math
+from datetime import date
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from constants import DAYS_TO_CHECK
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_lg(keyword: str, response: Dict, search_api_url, session) -> Dict[str, Dict]:
+    """gets the job information from lg's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+        search_api_url (str): search api url for lg's career page
+        session (_type_): request session object
+
+    Returns:
+        Dict[str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_page(page_available_jobs, keyword):
+        page_relevant_jobs = {}
+        match_titles([job['postingTitle'] for job in page_available_jobs])
+        for job in page_available_jobs:
+            job_id = job['positionId']
+            curr_job_title = job['postingTitle']
+            posted_date = parse_posted_date(job['postingDate'], "%b %d, %Y")
+            today = date.today()
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        page_relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date,
+                            'apply': f"https://jobs.apple.com/en-us/details/{job_id}/{job['transformedPostingTitle']}?team={job['team']['teamCode']}"}
+        return page_relevant_jobs
+
+    def get_relevant_jobs_from_html_response(page_response, keyword):
+        response_relevant_jobs = {}
+        soup = BeautifulSoup(page_response['postings'], 'html.parser')
+        scripts = soup.find_all('tbody')
+        pages = 0
+        url = ""
+        if len(scripts) > 0:
+            data = scripts[0].text
+            data = data.replace("\n      window.APP_STATE = ", "")
+            data = data.replace(";\n", "").strip()
+            json_data = json.loads(data)
+            total_jobs = json_data['totalRecords']
+            pages = math.ceil(total_jobs / 20)
+            response_available_jobs = json_data['searchResults']
+            url = json_data['fullUrl']
+            response_relevant_jobs = get_relevant_jobs_from_page(
+                response_available_jobs, keyword)
+        return response_relevant_jobs, pages, url
+
+    relevant_jobs, no_of_pages, org_url = get_relevant_jobs_from_html_response(
+        response, keyword)
+    if no_of_pages > 1 and org_url != "":
+        curr_page_count = 2
+        while (curr_page_count < min(5, no_of_pages)):
+            new_url = org_url + f'&page={curr_page_count}'
+            new_response = get_response_for_search_url("GET", new_url, session)
+            if not new_response:
+                return relevant_jobs
+            new_relevant_jobs, new_pages, org_url = get_relevant_jobs_from_html_response(
+                new_response, keyword)
+            relevant_jobs.update(new_relevant_jobs)
+            curr_page_count += 1
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_lg(keyword, response, search_api_url, session)
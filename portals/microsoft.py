@@ -0,0 +1,55 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_microsoft(keyword: str, search_api_url: str, response: Dict, session) -> Dict[str, Dict]:
+    """gets the job information from microsoft's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        search_api_url (str): search api url for apple's career page
+        response (Dict): initial response from the search api url
+        session (request): request session object 
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_json_response(page_response):
+        page_relevant_jobs = {}
+        page_available_jobs = page_response["operationResult"]["result"]["jobs"]
+        match_titles([job['title'] for job in page_available_jobs if 'title' in job])
+        for job in page_available_jobs:
+            if 'title' in job:
+                job_id = job['jobId']
+                curr_job_title = job['title']
+                posted_date = parse_posted_date(job['postingDate'], "%Y-%m-%dT%H:%M:%S%z")
+                today = date.today()
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://careers.microsoft.com/us/en/job/{job_id}"}
+        return page_relevant_jobs
+
+    def get_posted_dates_from_json_response(page_response):
+        return [parse_posted_date(job['postingDate'], "%Y-%m-%dT%H:%M:%S%z")
+                for job in page_response["operationResult"]["result"]["jobs"] if 'postingDate' in job]
+
+    return get_paginated_jobs(response, page_size=20, max_pages=4,
+                              get_total=lambda page_response: page_response["operationResult"]["result"]["totalJobs"],
+                              build_page_request=lambda page_index, first_page: (
+                                  "GET", search_api_url + f'&pg={page_index + 1}', "", ""),
+                              parse_page=get_relevant_jobs_from_json_response,
+                              get_posted_dates=get_posted_dates_from_json_response if 'o=Recent' in search_api_url else None)
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_microsoft(keyword, search_api_url, response, session)
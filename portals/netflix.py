@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_netflix(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """gets all the revelant jobs from netflix's careers page
+
+    Args:
+        keyword (str): keyword to match in job title
+        response (Dict): raw response from netflix's page
+
+    Returns:
+        Dict[str, Dict]: relevant positions with their information
+    """
+    relevant_jobs = {}
+    available_jobs = response['records']['postings']
+    match_titles([job['text'] for job in available_jobs])
+    for job in available_jobs:
+        job_id = job['external_id']
+        curr_job_title = job['text']
+        posted_date = parse_posted_date(job['created_at'], "%Y-%m-%dT%H:%M:%S%z")
+        today = date.today()
+        if title_matches_keyword(curr_job_title, keyword):
+            if not is_title_ignored(curr_job_title):
+                date_difference = today - posted_date
+                if date_difference.days < DAYS_TO_CHECK:
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://jobs.netflix.com/jobs/{job_id}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_netflix(keyword, response)
@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_oracle(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """gets the job information from oracle's career page
+
+    Args:
+        keyword (str): keywords to match for job title
+        response (Dict): initial response from the oracle's career page
+
+    Returns:
+        Dict[str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    if "items" not in response:
+        return relevant_jobs
+    if len(response['items']) == 0:
+        return relevant_jobs
+    if "requisitionList" not in response['items'][0]:
+        return relevant_jobs
+    available_jobs = response['items'][0]['requisitionList']
+    match_titles([job['Title'] for job in available_jobs if 'Title' in job])
+    for job in available_jobs:
+        if 'title' in job:
+            job_id = job['Id']
+            curr_job_title = job['Title']
+            posted_date = parse_posted_date(job['PostedDate'], "%Y-%m-%dT%H:%M:%S%z")
+            today = date.today()
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://careers.oracle.com/jobs/#en/sites/jobsearch/job/{job_id}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_oracle(keyword, response)
@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_oracle_cloud_based_company(page_response, job_keyword, apply_prefix):
+    relevant_jobs = {}
+    if "items" not in page_response:
+        return relevant_jobs
+    if (len(page_response["items"]) > 0):
+        available_jobs = page_response["items"][0]["requisitionList"]
+        match_titles([job['Title'] for job in available_jobs if 'Title' in job])
+        for job in available_jobs:
+            if 'Title' in job:
+                job_id = str(job['Id'])
+                curr_job_title = job['Title']
+                posted_date = parse_posted_date(job['PostedDate'], "%Y-%m-%dT%H:%M:%S%z")
+                today = date.today()
+                if title_matches_keyword(curr_job_title, job_keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': f"{apply_prefix}{job_id}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter
+
+    params: apply_prefix, the job id is appended to it.
+    """
+    return for_oracle_cloud_based_company(response, keyword, params['apply_prefix'])
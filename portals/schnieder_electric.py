@@ -0,0 +1,66 @@
+import math
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_schnieder_electric(keyword, response, search_api_url, session) -> Dict[str, Dict]:
+    """gets the job information from schnieder electric's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_json_response(page_response, keyword):
+        page_relevant_jobs = {}
+        no_of_pages = 0
+        if "totalCount" not in page_response:
+            return page_relevant_jobs, no_of_pages
+        total_jobs = page_response["totalCount"]
+        if total_jobs == 0:
+            return page_relevant_jobs, no_of_pages
+        page_available_jobs = page_response["jobs"]
+        no_of_pages = math.ceil(total_jobs / 10)
+        match_titles([job['data']['title'] for job in page_available_jobs if 'req_id' in job['data']])
+        for job in page_available_jobs:
+            if 'req_id' in job['data']:
+                job_id = job['data']['req_id']
+                curr_job_title = job['data']['title']
+                posted_date = parse_posted_date(job['data']['meta_data']['last_mod'], "%Y-%m-%dT%H:%M:%S%z")
+                today = date.today()
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': job['data']['apply_url']}
+        return page_relevant_jobs, no_of_pages
+
+    relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+        response, keyword)
+    if no_of_pages > 1:
+        curr_page_count = 2
+        while (curr_page_count < min(20, no_of_pages)):
+            new_search_api_url = search_api_url + f'&page={curr_page_count}'
+            new_response = get_response_for_search_url(
+                "GET", new_search_api_url, session)
+            if not new_response:
+                return relevant_jobs
+            new_relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+                new_response, keyword)
+            relevant_jobs.update(new_relevant_jobs)
+            curr_page_count += 1
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_schnieder_electric(keyword, response, search_api_url, session)
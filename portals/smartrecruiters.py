@@ -0,0 +1,68 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from html_parsing import parse_html
+from http_engine import get_response_for_search_url
+from job_details_cache import get_job_details
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def get_smartrecruiters_job_details(job_url, session):
+    def fetch_job_details():
+        job_data_response = get_response_for_search_url(
+            "GET", job_url, session)
+        job_data_soup = parse_html(
+            job_data_response, "meta", {"itemprop": ["addressCountry", "datePosted"]})
+        # get location
+        job_location_data = job_data_soup.find_all(
+            "meta", {"itemprop": "addressCountry"})
+        if (len(job_location_data) == 0):
+            return None
+        # get posted date
+        job_date = job_data_soup.find_all(
+            "meta", {"itemprop": "datePosted"})
+        return {'location': job_location_data[0]['content'],
+                'posted_date': job_date[0]['content'] if len(job_date) > 0 else None}
+
+    return get_job_details(job_url, fetch_job_details)
+
+
+def smartrecruiters_based_company(company_page_respone, company_job_keyword, session):
+    relevant_jobs = {}
+    soup = parse_html(company_page_respone, "li", {"class": "opening-job"})
+    available_jobs = soup.find_all("li", {"class": "opening-job"})
+    if len(available_jobs) > 0:
+        for job in available_jobs:
+            if "href" not in job.contents[0].attrs:
+                continue
+            # check if department_jobs is div or not
+            job_url = job.contents[0]["href"]
+            job_id = job_url.split("=")[-1]
+            job_title = job.contents[0].text.replace(
+                'Full-time', '').split('-')[0].split('(')[0]
+            if title_matches_keyword(job_title, company_job_keyword):
+                if not is_title_ignored(job_title):
+                    job_details = get_smartrecruiters_job_details(job_url, session)
+                    if job_details is None:
+                        return relevant_jobs
+                    job_location = job_details['location']
+                    if job_location:
+                        if job_location not in ['United States', 'US', 'USA', 'United States of America', 'San Francisco', 'New York']:
+                            continue
+                    today = date.today()
+                    posted_date = date.today()
+                    if job_details['posted_date']:
+                        posted_date = parse_posted_date(job_details['posted_date'], "%Y-%m-%dT%H:%M:%S.%fZ")
+                    date_difference = today - posted_date
+                    if date_difference.days < DAYS_TO_CHECK:
+                        relevant_jobs[job_id] = {
+                            'title': job_title, 'posted_date': posted_date, 'apply': job_url}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return smartrecruiters_based_company(response, keyword, session)
@@ -0,0 +1,43 @@
+from datetime import date
+from typing import Dict
+
+from html_parsing import parse_page
+from title_filter import is_title_ignored, title_matches_keyword
+
+
+def for_stripe(keyword, response) -> Dict[str, Dict]:
+    """gets the job information from stripe's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    soup = parse_page(response)
+    scripts = soup.find_all('tbody')
+    if len(scripts) > 0:
+        data = scripts[0]
+        for item in data.contents:
+            if item.text == '\n':
+                continue
+            temp = item.contents[1]
+            if temp.text == 'No results':
+                break
+            job_link = temp.contents[0]['href']
+            job_id = job_link.split('/')[-1]
+            curr_job_title = item.contents[1].contents[0].text
+            if title_matches_keyword(curr_job_title, keyword):
+                if not is_title_ignored(curr_job_title):
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': date.today(),
+                        'apply': job_link}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_stripe(keyword, response)
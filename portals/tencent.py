@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_tencent(keyword: str, response: Dict) -> Dict[str, Dict]:
+    """get the jobs from tencent's career page
+
+    Args:
+        keyword (str): keywords to match for tencent's career page
+        response (Dict): initial response from tencent's career page
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    relevant_jobs = {}
+    available_jobs = response['Data']['Posts']
+    match_titles([job['RecruitPostName'] for job in available_jobs])
+    for job in available_jobs:
+        job_id = str(job['RecruitPostId'])
+        curr_job_title = job['RecruitPostName']
+        posted_date = parse_posted_date(job['LastUpdateTime'], "%B %d,%Y")
+        today = date.today()
+        if title_matches_keyword(curr_job_title, keyword):
+            if not is_title_ignored(curr_job_title):
+                date_difference = today - posted_date
+                if date_difference.days < DAYS_TO_CHECK:
+                    relevant_jobs[job_id] = {
+                        'title': curr_job_title, 'posted_date': posted_date, 'apply': f"{job['PostURL']}"}
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_tencent(keyword, response)
@@ -0,0 +1,42 @@
+from typing import Dict
+
+
+def for_tesla(keyword, response) -> Dict[str, Dict]:
+    """gets the job information from tesla's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        response (Dict): initial response from the search api url
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    # relevant_jobs = {}
+    # all_locations_data = response["geo"][0]["sites"][0]['states']
+    # location_ids = []
+    # for state in all_locations_data:
+    #     cities = state['cities']
+    #     for city in cities.values():
+    #         location_ids.extend(city)
+    # total_jobs = response["listings"]
+    # if len(total_jobs) > 0:
+    #     for job in total_jobs:
+    #         if 'id' in job:
+
+    #             if fuzz.ratio(curr_job_title, keyword) > FUZZY_RATIO_MATCH:
+    #                 ignore_position = False
+    #                 for term in TERMS_TO_IGNORE:
+    #                     if term in curr_job_title:
+    #                         ignore_position = True
+    #                         break
+    #                 if not ignore_position:
+    #                     relevant_jobs[job_id] = {
+    #                         'title': curr_job_title, 'posted_date': date.today(),
+    #                         'apply': job_link}
+    # return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_tesla(keyword, response)
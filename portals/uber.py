@@ -0,0 +1,66 @@
+import math
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from http_engine import get_response_for_search_url
+from job_dates import parse_posted_date
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+
+
+def for_uber(keyword: str, response: Dict, search_api_url, search_api_header, session) -> Dict[str, Dict]:
+    """gets the job information from uber's career page
+
+    Args:
+        keyword (str): keyword to match with job title
+        search_api_header (str): search api header for uber's career page
+        response (Dict): initial response from the search api url
+        session (request): request session object 
+
+    Returns:
+        [str, Dict]: relevant jobs
+    """
+    def get_relevant_jobs_from_json_response(page_response, keyword):
+        page_relevant_jobs = {}
+        total_jobs = page_response["data"]["totalResults"]["low"]
+        no_of_pages = math.ceil(total_jobs / 10)
+        page_available_jobs = page_response["data"]["results"]
+        match_titles([job['title'] for job in page_available_jobs if 'title' in job])
+        for job in page_available_jobs:
+            if 'title' in job:
+                job_id = str(job['id'])
+                curr_job_title = job['title']
+                posted_date = parse_posted_date(job['updatedDate'], "%Y-%m-%dT%H:%M:%S%z")
+                today = date.today()
+                if job['location']['country'] != "USA":
+                    continue
+                if title_matches_keyword(curr_job_title, keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': f"https://www.uber.com/global/en/careers/list/{job_id}"}
+        return page_relevant_jobs, no_of_pages
+
+    relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+        response, keyword)
+    if no_of_pages > 1:
+        curr_page_count = 1
+        while (curr_page_count < min(7, no_of_pages)):
+            new_header = search_api_header.deepcopy()
+            new_header['page'] = curr_page_count
+            new_response = get_response_for_search_url(
+                "POST", search_api_url, session, new_header)
+            if not new_response:
+                return relevant_jobs
+            new_relevant_jobs, no_of_pages = get_relevant_jobs_from_json_response(
+                new_response, keyword)
+            relevant_jobs.update(new_relevant_jobs)
+            curr_page_count += 1
+    return relevant_jobs
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter"""
+    return for_uber(keyword, response, search_api_url, search_api_header, session)
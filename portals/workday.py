@@ -0,0 +1,82 @@
+import copy
+import urllib.parse
+from datetime import date
+from typing import Dict
+
+from constants import DAYS_TO_CHECK
+from paginator import get_paginated_jobs
+from title_filter import is_title_ignored, match_titles, title_matches_keyword
+from utils import get_past_date
+
+
+def get_workday_apply_prefix(search_api_url: str) -> str:
+    """derives the apply link prefix of a workday tenant from its cxs search api url
+
+    https://{host}/wday/cxs/{tenant}/{site}/jobs gives https://{host}/{site}, and
+    https://{host}.myworkdaysite.com/wday/cxs/{tenant}/{site}/jobs gives
+    https://{host}.myworkdaysite.com/recruiting/{tenant}/{site}.
+
+    Args:
+        search_api_url (str): search api url
+
+    Returns:
+        str: apply link prefix, the job's external path is appended to it
+    """
+    url = urllib.parse.urlparse(search_api_url)
+    path_parts = url.path.strip('/').split('/')
+    if len(path_parts) < 4 or path_parts[:2] != ['wday', 'cxs']:
+        return f'{url.scheme}://{url.netloc}'
+    tenant, site = path_parts[2], path_parts[3]
+    if url.netloc.endswith('myworkdaysite.com'):
+        return f'{url.scheme}://{url.netloc}/recruiting/{tenant}/{site}'
+    return f'{url.scheme}://{url.netloc}/{site}'
+
+
+def workday_based_company(company_page_respone, company_job_keyword, company_apply_link_prefix, search_api_header,
+                          search_api_url, session, max_pages=4):
+    def get_relevant_jobs_from_json_response(page_response):
+        page_relevant_jobs = {}
+        if "total" not in page_response:
+            return page_relevant_jobs
+        page_available_jobs = page_response["jobPostings"]
+        match_titles([job['title'] for job in page_available_jobs if 'title' in job])
+        for job in page_available_jobs:
+            if 'title' in job:
+                job_id = job['bulletFields'][0]
+                curr_job_title = job['title']
+                posted_date = get_past_date(job['postedOn'].replace(
+                    "Posted ", "").replace("+", "").lower())
+                today = date.today()
+                if title_matches_keyword(curr_job_title, company_job_keyword):
+                    if not is_title_ignored(curr_job_title):
+                        date_difference = today - posted_date
+                        if date_difference.days < DAYS_TO_CHECK:
+                            page_relevant_jobs[job_id] = {
+                                'title': curr_job_title, 'posted_date': posted_date, 'apply': f"{company_apply_link_prefix}{job['externalPath']}"}
+        return page_relevant_jobs
+
+    def build_page_request(page_index, first_page):
+        # every page gets its own payload, so the pages can be requested at once
+        page_search_api_header = copy.deepcopy(search_api_header)
+        page_search_api_header['offset'] += 20 * page_index
+        return "POST", search_api_url, page_search_api_header, ""
+
+    if "total" not in company_page_respone:
+        return {}
+    # keyed by the bulletFields job id, so overlapping pages are deduplicated
+    return get_paginated_jobs(company_page_respone, page_size=20, max_pages=max_pages,
+                              get_total=lambda page_response: page_response.get("total", 0),
+                              build_page_request=build_page_request,
+                              parse_page=get_relevant_jobs_from_json_response)
+
+
+def get_relevant_jobs(keyword: str, response, search_api_url: str, search_api_header: Dict,
+                      search_api_extra_header: Dict, session, params: Dict) -> Dict[str, Dict]:
+    """portal adapter entry point, see portals.get_portal_adapter
+
+    params: apply_prefix, derived from the search api url when missing, and
+    max_pages, the number of result pages to visit.
+    """
+    apply_prefix = params.get('apply_prefix') or get_workday_apply_prefix(search_api_url)
+    return workday_based_company(response, keyword, apply_prefix, copy.deepcopy(search_api_header),
+                                 search_api_url, session, params.get('max_pages', 4))
@@ -0,0 +1,97 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from constants import DATA_FOLDER_LOCATION
+
+# A cache is a database in the data folder shared by all the sets. Its state
+# lives in a dict made by new_sqlite_cache: the connection, opened on first
+# use, the lock every query of the cache holds, and when it was last evicted.
+# The eviction runs when the cache is opened and, since a long running daemon
+# keeps it open, again on writes once evict_interval went by.
+
+
+def new_sqlite_cache(db_name: str, schema_version: int, schema: List[str],
+                     evict: Callable[[sqlite3.Connection], int], evict_interval: timedelta) -> Dict:
+    """describes a cache database, it is opened on first use
+
+    Args:
+        db_name (str): database file name in the data folder
+        schema_version (int): version of the schema, a database of another version is emptied
+        schema (List[str]): statements creating the tables and indexes of the cache
+        evict (Callable[[sqlite3.Connection], int]): drops the outdated entries and returns
+            how many were dropped, it runs with the lock held and is committed by the caller
+        evict_interval (timedelta): time between two evictions of an open cache
+
+    Returns:
+        Dict: cache state, given to the other functions of this module
+    """
+    return {'db_name': db_name, 'schema_version': schema_version, 'schema': schema, 'evict': evict,
+            'evict_interval': evict_interval, 'connection': None, 'lock': threading.Lock(), 'evicted': None}
+
+
+def open_sqlite_cache(cache: Dict) -> sqlite3.Connection:
+    """opens a cache database, creating its tables and evicting the outdated entries on first use
+
+    Args:
+        cache (Dict): cache state made by new_sqlite_cache
+
+    Returns:
+        sqlite3.Connection: connection to the cache database, queried with cache['lock'] held
+    """
+    with cache['lock']:
+        if cache['connection'] is None:
+            connection = sqlite3.connect(os.path.join(DATA_FOLDER_LOCATION, cache['db_name']),
+                                         check_same_thread=False)
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            if connection.execute('PRAGMA user_version').fetchone()[0] != cache['schema_version']:
+                # a cache only holds copies, so another layout is dropped instead of migrated
+                tables = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+                for (table,) in tables:
+                    connection.execute(f'DROP TABLE "{table}"')
+            for statement in cache['schema']:
+                connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {cache['schema_version']}")
+            connection.commit()
+            cache['connection'] = connection
+            evict_sqlite_cache(cache)
+        return cache['connection']
+
+
+def evict_sqlite_cache(cache: Dict):
+    """drops the outdated entries of an open cache, the caller holds cache['lock']
+
+    Args:
+        cache (Dict): cache state made by new_sqlite_cache
+    """
+    cache['evicted'] = datetime.now()
+    dropped_entries = cache['evict'](cache['connection'])
+    cache['connection'].commit()
+    if dropped_entries > 0:
+        logging.info(f"Evicted {dropped_entries} entries from {cache['db_name']}.")
+
+
+def evict_sqlite_cache_if_due(cache: Dict):
+    """evicts an open cache once evict_interval went by since its last eviction, the caller holds cache['lock']
+
+    Args:
+        cache (Dict): cache state made by new_sqlite_cache
+    """
+    if datetime.now() - cache['evicted'] >= cache['evict_interval']:
+        evict_sqlite_cache(cache)
+
+
+def close_sqlite_cache(cache: Dict):
+    """closes a cache database
+
+    Args:
+        cache (Dict): cache state made by new_sqlite_cache
+    """
+    with cache['lock']:
+        if cache['connection'] is not None:
+            cache['connection'].close()
+            cache['connection'] = None
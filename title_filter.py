@@ -0,0 +1,177 @@
+import contextvars
+import csv
+import os
+import re
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterable, List, Sequence, Tuple
+
+from constants import TERMS_TO_IGNORE, COMPANY_TERMS_TO_IGNORE_CSV, TITLE_FILTER_CACHE_SIZE, FUZZY_RATIO_MATCH
+
+
+@lru_cache(maxsize=None)
+def get_title_filter(terms_to_ignore: Tuple[str, ...]) -> Callable[[str], bool]:
+    """compiles the terms to ignore into a single regex and caches its verdict per job title
+
+    The same titles come back for every keyword of a company, so a title is
+    only matched the first time it is seen.
+
+    Args:
+        terms_to_ignore (Tuple[str, ...]): terms which rule out a job title, case sensitive
+
+    Returns:
+        Callable[[str], bool]: tells whether a job title holds one of the terms
+    """
+    if not terms_to_ignore:
+        return lambda job_title: False
+    terms_pattern = re.compile('|'.join(re.escape(term) for term in terms_to_ignore))
+
+    @lru_cache(maxsize=TITLE_FILTER_CACHE_SIZE)
+    def is_ignored(job_title: str) -> bool:
+        return terms_pattern.search(job_title) is not None
+
+    return is_ignored
+
+
+# title filter of the set being checked, the parsers read it through
+# is_title_ignored so it doesn't have to be passed down to every portal
+title_filter_var = contextvars.ContextVar(
+    'title_filter', default=get_title_filter(tuple(TERMS_TO_IGNORE)))
+
+
+def is_title_ignored(job_title: str) -> bool:
+    """tells whether a job title holds one of the terms to ignore of the current set
+
+    Args:
+        job_title (str): job title
+
+    Returns:
+        bool: True when the job should be skipped
+    """
+    return title_filter_var.get()(job_title)
+
+
+@contextmanager
+def ignoring_terms(terms_to_ignore: Iterable[str]):
+    """makes is_title_ignored use the given terms within the block
+
+    Args:
+        terms_to_ignore (Iterable[str]): terms which rule out a job title
+    """
+    token = title_filter_var.set(get_title_filter(tuple(terms_to_ignore)))
+    try:
+        yield
+    finally:
+        title_filter_var.reset(token)
+
+
+def get_terms_to_ignore(csv_folder_location: str) -> Tuple[str, ...]:
+    """gets the terms to ignore of a set, from its terms_to_ignore.csv when it has one
+
+    Args:
+        csv_folder_location (str): folder of the set's csv files
+
+    Returns:
+        Tuple[str, ...]: terms to ignore, TERMS_TO_IGNORE when the set has no file
+    """
+    terms_to_ignore_csv = os.path.join(csv_folder_location, COMPANY_TERMS_TO_IGNORE_CSV)
+    if not os.path.exists(terms_to_ignore_csv):
+        return tuple(TERMS_TO_IGNORE)
+    with open(terms_to_ignore_csv, newline='') as terms_to_ignore_csvfile:
+        reader = csv.DictReader(terms_to_ignore_csvfile)
+        return tuple(row['Term'] for row in reader if row['Term'])
+
+
+def get_title_scores(job_titles: Sequence[str], keywords: Sequence[str]):
+    """scores every job title against every keyword in one vectorized call
+
+    numpy and rapidfuzz are imported on first use, so a run whose companies
+    are all disabled doesn't load them.
+
+    Args:
+        job_titles (Sequence[str]): job titles
+        keywords (Sequence[str]): keywords of the company
+
+    Returns:
+        numpy.ndarray: fuzzy ratio between 0 and 100, a row per job title and a column per keyword
+    """
+    import numpy
+    from rapidfuzz import fuzz, process
+
+    return process.cdist(job_titles, keywords, scorer=fuzz.ratio, dtype=numpy.float64)
+
+
+def get_title_matches(job_titles: Sequence[str], keywords: Sequence[str]) -> List[FrozenSet[str]]:
+    """gets the keywords matched by each job title
+
+    A score is rounded like fuzzywuzzy did before it is compared with
+    FUZZY_RATIO_MATCH, so the matches don't change with the library.
+
+    Args:
+        job_titles (Sequence[str]): job titles
+        keywords (Sequence[str]): keywords of the company
+
+    Returns:
+        List[FrozenSet[str]]: matched keywords, in the order of the job titles
+    """
+    is_match = get_title_scores(job_titles, keywords).round() > FUZZY_RATIO_MATCH
+    return [frozenset(keyword for keyword, keyword_is_match in zip(keywords, title_is_match) if keyword_is_match)
+            for title_is_match in is_match]
+
+
+# keywords of the company being polled and the keywords matched by every job
+# title seen in the poll, the cache lives as long as the poll
+keyword_matches_var = contextvars.ContextVar('keyword_matches', default=((), {}))
+
+
+def match_titles(job_titles: Iterable[str]):
+    """scores the new job titles of a response page against all the keywords of the company at once
+
+    Parsers call it with every title of a page before walking its jobs, so
+    title_matches_keyword only reads the verdicts.
+
+    Args:
+        job_titles (Iterable[str]): job titles of the page
+    """
+    keywords, title_matches = keyword_matches_var.get()
+    new_job_titles = list(dict.fromkeys(job_title for job_title in job_titles
+                                        if isinstance(job_title, str) and job_title not in title_matches))
+    if not keywords or not new_job_titles:
+        return
+    title_matches.update(zip(new_job_titles, get_title_matches(new_job_titles, keywords)))
+
+
+def title_matches_keyword(job_title: str, keyword: str) -> bool:
+    """tells whether a job title is close enough to a searched keyword
+
+    Args:
+        job_title (str): job title
+        keyword (str): keyword the job was searched for
+
+    Returns:
+        bool: True when the fuzzy ratio is above FUZZY_RATIO_MATCH
+    """
+    keywords, title_matches = keyword_matches_var.get()
+    if keyword not in keywords:
+        from rapidfuzz import fuzz
+
+        return int(round(fuzz.ratio(job_title, keyword))) > FUZZY_RATIO_MATCH
+    matching_keywords = title_matches.get(job_title)
+    if matching_keywords is None:
+        matching_keywords = get_title_matches([job_title], keywords)[0]
+        title_matches[job_title] = matching_keywords
+    return keyword in matching_keywords
+
+
+@contextmanager
+def matching_keywords(keywords: Iterable[str]):
+    """scores the job titles against all the given keywords at once within the block
+
+    Args:
+        keywords (Iterable[str]): keywords of the company being polled
+    """
+    token = keyword_matches_var.set((tuple(keywords), {}))
+    try:
+        yield
+    finally:
+        keyword_matches_var.reset(token)